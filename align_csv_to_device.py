@@ -10,14 +10,71 @@ the runtime state.
 """
 
 import argparse
+import contextlib
 import csv
+import io
 import json
+import mmap
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, MutableMapping, Optional
-
-from core.offset_sync import host_to_dev
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:  # Optional dependency used for the vectorised alignment path.
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - the row-wise fallback is used instead
+    _np = None
+
+try:  # Optional dependency: streaming columnar CSV parser.
+    import pyarrow as _pa  # type: ignore
+    import pyarrow.compute as _pc  # type: ignore
+    from pyarrow import csv as _pacsv  # type: ignore
+except Exception:  # pragma: no cover - pandas or the row-wise path is used
+    _pa = None
+    _pc = None
+    _pacsv = None
+
+try:  # Optional dependency used when pyarrow is unavailable.
+    import pandas as _pd  # type: ignore
+except Exception:  # pragma: no cover - the row-wise fallback is used instead
+    _pd = None
+
+from core.json_io import dumps, loads
+from core.offset_sync import get_offset_ns, host_to_dev_array
 
 _DEVICES = ("vp1", "vp2")
+_CHUNK_ROWS = 65536
+_ARROW_BLOCK_SIZE = 8 << 20
+# Only these columns are parsed by pyarrow; other columns are never type
+# inferred, so unrelated data cannot make valid input fail.
+_ARROW_COLUMN_TYPES: Dict[str, Any] = (
+    {
+        "t_host_ns": _pa.int64(),
+        "timestamp_ns": _pa.int64(),
+        "event": _pa.string(),
+        "payload": _pa.string(),
+    }
+    if _pa is not None
+    else {}
+)
+_OUTPUT_BUFFER_SIZE = 1 << 20
+_FLUSH_ROWS = 4096
+
+# Host timestamps, event names and raw payload strings of one parsed chunk.
+_Batch = Tuple[Any, Sequence[Optional[str]], Sequence[Optional[str]]]
 
 
 def _parse_args() -> argparse.Namespace:
@@ -43,6 +100,16 @@ def _parse_args() -> argparse.Namespace:
         default=Path("aligned_events.jsonl"),
         help="Zielpfad für die ausgerichteten Events (default: %(default)s)",
     )
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=1,
+        help=(
+            "Anzahl paralleler Prozesse, 0 = alle CPU-Kerne (default: %(default)s). "
+            "Mehr als ein Prozess setzt einen Datensatz pro Zeile voraus."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -76,57 +143,71 @@ def _resolve_runtime_state_path(explicit: Optional[Path]) -> Path:
 
 
 def _load_json_lines(path: Path) -> Iterable[Mapping[str, object]]:
-    with path.open("r", encoding="utf-8") as fp:
-        content = fp.read()
-    try:
-        parsed = json.loads(content)
-    except json.JSONDecodeError:
-        for line in content.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            yield json.loads(line)
+    with path.open("rb") as fp:
+        try:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return
+        with mapped:
+            try:
+                with memoryview(mapped) as view:
+                    parsed = loads(view)
+            except json.JSONDecodeError:
+                for line in iter(mapped.readline, b""):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    yield loads(line)
+                return
+
+    if isinstance(parsed, list):
+        for item in parsed:
+            if isinstance(item, Mapping):
+                yield item
+    elif isinstance(parsed, Mapping):
+        yield parsed
     else:
-        if isinstance(parsed, list):
-            for item in parsed:
-                if isinstance(item, Mapping):
-                    yield item
-        elif isinstance(parsed, Mapping):
-            yield parsed
-        else:
-            raise ValueError(f"Unerwartetes JSON-Format in {path}")
+        raise ValueError(f"Unerwartetes JSON-Format in {path}")
 
 
 def _extract_recording_ids(data: Iterable[Mapping[str, object]]) -> Dict[str, str]:
     latest: Dict[str, str] = {}
 
-    def update_from_mapping(mapping: Mapping[str, object]) -> None:
-        device = mapping.get("device")
-        if isinstance(device, str) and device.lower() in _DEVICES:
-            rec = mapping.get("recording_id")
-            if rec is not None:
-                latest[device.lower()] = str(rec)
-        for key, value in mapping.items():
-            lowered = key.lower()
-            if lowered in _DEVICES:
+    # Depth-first walk with an explicit stack that visits every mapping once,
+    # in exactly the reverse of document order.  The first recording id seen
+    # per device is therefore the latest one, and the walk stops as soon as
+    # all devices are resolved.  Stack items are either a mapping to visit
+    # (with the device named by its parent key, if any) or a found id.
+    stack: List[Tuple[bool, Optional[str], Any]] = []
+    for entry in reversed(list(data)):
+        stack.append((True, None, entry))
+        while stack:
+            is_visit, device, item = stack.pop()
+            if not is_visit:
+                if device not in latest:
+                    latest[device] = item
+                    if len(latest) == len(_DEVICES):
+                        return latest
+                continue
+
+            mapping: Mapping[str, object] = item
+            if device is not None:
+                rec = mapping.get("recording_id")
+                if rec is not None:
+                    stack.append((False, device, str(rec)))
+            own_device = mapping.get("device")
+            if isinstance(own_device, str) and own_device.lower() in _DEVICES:
+                rec = mapping.get("recording_id")
+                if rec is not None:
+                    stack.append((False, own_device.lower(), str(rec)))
+            for key, value in mapping.items():
                 if isinstance(value, Mapping):
-                    rec = value.get("recording_id")
-                    if rec is not None:
-                        latest[lowered] = str(rec)
-                    update_from_mapping(value)
+                    lowered = key.lower()
+                    stack.append((True, lowered if lowered in _DEVICES else None, value))
                 elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, Mapping):
-                            update_from_mapping(item)
-            if isinstance(value, Mapping):
-                update_from_mapping(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, Mapping):
-                        update_from_mapping(item)
-
-    for entry in data:
-        update_from_mapping(entry)
+                    stack.extend(
+                        (True, None, child) for child in value if isinstance(child, Mapping)
+                    )
 
     missing = [device for device in _DEVICES if device not in latest]
     if missing:
@@ -137,27 +218,451 @@ def _extract_recording_ids(data: Iterable[Mapping[str, object]]) -> Dict[str, st
     return latest
 
 
+# First characters a JSON document can start with (``NaN``/``Infinity`` are
+# accepted by :func:`json.loads`).  Anything else is kept as plain text without
+# paying for a failed parse.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
 def _parse_payload(raw: str | None) -> object | None:
     if raw is None:
         return None
     text = raw.strip()
     if not text:
         return None
+    if text[0] not in _JSON_START_CHARS:
+        return text
     try:
         return json.loads(text)
     except json.JSONDecodeError:
         return text
 
 
-def _ensure_monotonic(
-    previous: MutableMapping[str, Optional[int]], device: str, value: int
+def _order_error(device: str, value: int, last: int) -> ValueError:
+    return ValueError(f"Zeitordnung verletzt für {device}: {value} < {last}")
+
+
+def _ensure_monotonic_array(
+    previous: MutableMapping[str, Optional[int]], device: str, values: Any
 ) -> None:
+    """Ensure an ``int64`` column never decreases, also across batches."""
+
+    if not len(values):
+        return
     last = previous.get(device)
-    if last is not None and value < last:
-        raise ValueError(
-            f"Zeitordnung verletzt für {device}: {value} < {last}"
+    if last is not None and values[0] < last:
+        raise _order_error(device, int(values[0]), last)
+    bad = _np.flatnonzero(values[1:] < values[:-1])
+    if bad.size:
+        index = int(bad[0]) + 1
+        raise _order_error(device, int(values[index]), int(values[index - 1]))
+    previous[device] = int(values[-1])
+
+
+# Output line layout; keys keep the order the dict-based encoder produced.
+_RECORD_TEMPLATE = (
+    b'{"event":%b,"t_host_ns":%d,'
+    b'"vp1":{"t_world_ns":%d,"rec_id":%b},'
+    b'"vp2":{"t_world_ns":%d,"rec_id":%b}%b}\n'
+)
+
+
+class _RecordFormatter:
+    """Format aligned rows straight into JSONL bytes without per-row dicts.
+
+    Recording ids are encoded once and event names are cached, so only the
+    integers and (rare) payloads are serialised per row.
+    """
+
+    def __init__(self, recording_ids: Mapping[str, str]) -> None:
+        self._rec_vp1 = dumps(recording_ids["vp1"])
+        self._rec_vp2 = dumps(recording_ids["vp2"])
+        self._events: Dict[str, bytes] = {}
+
+    def format(
+        self,
+        event_name: str,
+        t_host_ns: int,
+        world_vp1: int,
+        world_vp2: int,
+        payload: object | None,
+    ) -> bytes:
+        encoded_event = self._events.get(event_name)
+        if encoded_event is None:
+            encoded_event = self._events[event_name] = dumps(event_name)
+        tail = b',"payload":' + dumps(payload) if payload is not None else b""
+        return _RECORD_TEMPLATE % (
+            encoded_event,
+            t_host_ns,
+            world_vp1,
+            self._rec_vp1,
+            world_vp2,
+            self._rec_vp2,
+            tail,
+        )
+
+
+def _pandas_host_column(chunk: Any, first_row: int) -> Any:
+    """Return the host timestamps of *chunk* as an ``int64`` array."""
+
+    columns = chunk.columns
+    if "t_host_ns" in columns:
+        raw = chunk["t_host_ns"]
+        if "timestamp_ns" in columns:
+            raw = raw.where(raw != "", chunk["timestamp_ns"])
+    elif "timestamp_ns" in columns:
+        raw = chunk["timestamp_ns"]
+    else:
+        raise KeyError("Spalte 't_host_ns' fehlt in der CSV")
+
+    try:
+        return raw.astype("int64").to_numpy()
+    except (TypeError, ValueError, OverflowError):
+        for offset, value in enumerate(raw.tolist()):
+            if value == "" and "timestamp_ns" not in columns:
+                raise KeyError("Spalte 't_host_ns' fehlt in der CSV")
+            try:
+                int(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"Ungültiger t_host_ns in Zeile {first_row + offset}: {value}"
+                ) from exc
+        raise
+
+
+def _iter_pandas_batches(csv_path: Path) -> Iterator[_Batch]:
+    first_row = 1
+    reader = _pd.read_csv(
+        csv_path,
+        chunksize=_CHUNK_ROWS,
+        # Timestamps are read as text so ``astype`` parses them like ``int()``
+        # and rejects values such as "1.5" instead of truncating floats.
+        dtype={"t_host_ns": str, "timestamp_ns": str, "event": str, "payload": str},
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    for chunk in reader:
+        count = len(chunk)
+        if not count:
+            continue
+        host = _pandas_host_column(chunk, first_row)
+        columns = chunk.columns
+        events = chunk["event"].tolist() if "event" in columns else [""] * count
+        payloads = (
+            chunk["payload"].tolist() if "payload" in columns else [None] * count
+        )
+        yield host, events, payloads
+        first_row += count
+
+
+def _arrow_host_column(batch: Any, first_row: int, header: frozenset[str]) -> Any:
+    """Return the host timestamps of a record *batch* as an ``int64`` array.
+
+    *header* holds the columns present in the CSV; absent ones are null-filled
+    by pyarrow and must not be mistaken for real data.
+    """
+
+    if "t_host_ns" in header:
+        raw = batch.column("t_host_ns")
+        if "timestamp_ns" in header:
+            raw = _pc.coalesce(raw, batch.column("timestamp_ns"))
+    elif "timestamp_ns" in header:
+        raw = batch.column("timestamp_ns")
+    else:
+        raise KeyError("Spalte 't_host_ns' fehlt in der CSV")
+
+    if raw.null_count:
+        if "timestamp_ns" not in header:
+            raise KeyError("Spalte 't_host_ns' fehlt in der CSV")
+        offset = raw.is_null().to_pylist().index(True)
+        raise ValueError(f"Ungültiger t_host_ns in Zeile {first_row + offset}: ")
+    return raw.to_numpy(zero_copy_only=False)
+
+
+def _read_csv_header(csv_path: Path) -> frozenset[str]:
+    with csv_path.open("r", encoding="utf-8-sig", newline="") as fp:
+        return frozenset(next(csv.reader(fp), ()))
+
+
+def _arrow_error(csv_path: Path, exc: Exception) -> ValueError:
+    # Only the timestamp columns are converted, so conversion errors point at
+    # them; anything else is a malformed CSV file.
+    if "conversion error" in str(exc):
+        return ValueError(f"Ungültiger t_host_ns in {csv_path}: {exc}")
+    return ValueError(f"CSV-Datei {csv_path} konnte nicht gelesen werden: {exc}")
+
+
+def _iter_arrow_batches(csv_path: Path) -> Iterator[_Batch]:
+    header = _read_csv_header(csv_path)
+    convert_options = _pacsv.ConvertOptions(
+        column_types=_ARROW_COLUMN_TYPES,
+        include_columns=list(_ARROW_COLUMN_TYPES),
+        include_missing_columns=True,
+        strings_can_be_null=False,
+    )
+    try:
+        reader = _pacsv.open_csv(
+            csv_path,
+            read_options=_pacsv.ReadOptions(block_size=_ARROW_BLOCK_SIZE),
+            # Quoted payloads may span lines, as the ``csv`` module allows.
+            parse_options=_pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=convert_options,
         )
-    previous[device] = value
+    except _pa.ArrowInvalid as exc:
+        raise _arrow_error(csv_path, exc) from exc
+
+    first_row = 1
+    while True:
+        try:
+            batch = reader.read_next_batch()
+        except StopIteration:
+            break
+        except _pa.ArrowInvalid as exc:
+            raise _arrow_error(csv_path, exc) from exc
+        count = batch.num_rows
+        if not count:
+            continue
+        host = _arrow_host_column(batch, first_row, header)
+        events = batch.column("event").to_pylist() if "event" in header else [""] * count
+        payloads = (
+            batch.column("payload").to_pylist() if "payload" in header else [None] * count
+        )
+        yield host, events, payloads
+        first_row += count
+
+
+def _align_batches(
+    batches: Iterable[_Batch], fp_out: IO[bytes], recording_ids: Mapping[str, str]
+) -> None:
+    """Vectorised alignment of pre-parsed column batches using NumPy."""
+
+    previous_world_ns: Dict[str, Optional[int]] = {device: None for device in _DEVICES}
+    format_record = _RecordFormatter(recording_ids).format
+    for host, events, payloads in batches:
+        world_columns: Dict[str, List[int]] = {}
+        for device in _DEVICES:
+            world = host_to_dev_array(host, device)
+            _ensure_monotonic_array(previous_world_ns, device, world)
+            world_columns[device] = world.tolist()
+
+        fp_out.write(
+            b"".join(
+                format_record(
+                    event_name or "",
+                    t_host_ns,
+                    world_vp1,
+                    world_vp2,
+                    _parse_payload(raw_payload),
+                )
+                for event_name, t_host_ns, world_vp1, world_vp2, raw_payload in zip(
+                    events,
+                    host.tolist(),
+                    world_columns["vp1"],
+                    world_columns["vp2"],
+                    payloads,
+                )
+            )
+        )
+
+
+# Number of aligned rows plus the first and last host timestamp written.
+_RowsSummary = Tuple[int, Optional[int], Optional[int]]
+
+
+def _write_rows(
+    rows: Iterable[Sequence[str]],
+    fieldnames: Sequence[str],
+    fp_out: IO[bytes],
+    recording_ids: Mapping[str, str],
+    offsets: Tuple[int, int],
+    first_row: int = 1,
+) -> _RowsSummary:
+    # Resolve column positions once; rows are plain ``csv.reader`` lists.
+    positions = {name: index for index, name in enumerate(fieldnames)}
+    idx_host = positions.get("t_host_ns")
+    idx_timestamp = positions.get("timestamp_ns")
+    idx_event = positions.get("event")
+    idx_payload = positions.get("payload")
+
+    format_record = _RecordFormatter(recording_ids).format
+    off_vp1, off_vp2 = offsets
+    first_host: Optional[int] = None
+    last_vp1: Optional[int] = None
+    last_vp2: Optional[int] = None
+    t_host_ns = None
+    count = 0
+    buf = bytearray()
+    pending = 0
+
+    for row in rows:
+        if not row:
+            continue
+        idx = first_row + count
+        width = len(row)
+        raw_host = row[idx_host] if idx_host is not None and idx_host < width else None
+        value = raw_host
+        if not value:
+            if idx_timestamp is None:
+                raise KeyError("Spalte 't_host_ns' fehlt in der CSV")
+            value = row[idx_timestamp] if idx_timestamp < width else None
+        try:
+            t_host_ns = int(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Ungültiger t_host_ns in Zeile {idx}: {raw_host}"
+            ) from exc
+
+        event_name = row[idx_event] if idx_event is not None and idx_event < width else ""
+        payload = _parse_payload(
+            row[idx_payload] if idx_payload is not None and idx_payload < width else None
+        )
+
+        world_vp1 = t_host_ns - off_vp1
+        if last_vp1 is not None and world_vp1 < last_vp1:
+            raise _order_error("vp1", world_vp1, last_vp1)
+        world_vp2 = t_host_ns - off_vp2
+        if last_vp2 is not None and world_vp2 < last_vp2:
+            raise _order_error("vp2", world_vp2, last_vp2)
+        last_vp1 = world_vp1
+        last_vp2 = world_vp2
+        if first_host is None:
+            first_host = t_host_ns
+        count += 1
+
+        buf += format_record(event_name, t_host_ns, world_vp1, world_vp2, payload)
+        pending += 1
+        if pending >= _FLUSH_ROWS:
+            fp_out.write(buf)
+            buf.clear()
+            pending = 0
+
+    if buf:
+        fp_out.write(buf)
+    return count, first_host, t_host_ns if count else None
+
+
+def _align_rows(
+    csv_path: Path, fp_out: IO[bytes], recording_ids: Mapping[str, str]
+) -> None:
+    """Row-wise alignment used when pyarrow/pandas/NumPy are unavailable."""
+
+    offsets = (get_offset_ns("vp1"), get_offset_ns("vp2"))
+    with csv_path.open("r", encoding="utf-8", newline="") as fp_in:
+        reader = csv.reader(fp_in)
+        fieldnames = next(reader, [])
+        _write_rows(reader, fieldnames, fp_out, recording_ids, offsets)
+
+
+def _chunk_ranges(csv_path: Path, parts: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Split the data section of *csv_path* into byte ranges on line boundaries."""
+
+    with csv_path.open("rb") as fp:
+        header_line = fp.readline()
+        data_start = fp.tell()
+        size = os.fstat(fp.fileno()).st_size
+        step = max(1, (size - data_start) // max(1, parts))
+        bounds = [data_start]
+        for index in range(1, parts):
+            fp.seek(data_start + index * step)
+            fp.readline()  # skip to the start of the next line
+            position = fp.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+        bounds.append(size)
+
+    fieldnames = next(csv.reader([header_line.decode("utf-8")]), [])
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    return fieldnames, ranges
+
+
+def _process_chunk(
+    csv_path: str,
+    fieldnames: Sequence[str],
+    start: int,
+    end: int,
+    part_path: str,
+    recording_ids: Mapping[str, str],
+    offsets: Tuple[int, int],
+    first_row: int = 1,
+) -> _RowsSummary:
+    """Align one byte range of the CSV into its own JSONL part file."""
+
+    with open(csv_path, "rb") as fp_in:
+        fp_in.seek(start)
+        data = fp_in.read(end - start)
+    rows = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+    with open(part_path, "wb", buffering=_OUTPUT_BUFFER_SIZE) as fp_out:
+        return _write_rows(rows, fieldnames, fp_out, recording_ids, offsets, first_row)
+
+
+def _align_parallel(
+    csv_path: Path,
+    output_path: Path,
+    recording_ids: Mapping[str, str],
+    workers: int,
+) -> None:
+    """Align byte-range chunks in worker processes and concatenate the parts."""
+
+    offsets = (get_offset_ns("vp1"), get_offset_ns("vp2"))
+    fieldnames, ranges = _chunk_ranges(csv_path, workers)
+    part_paths = [
+        output_path.with_name(f"{output_path.name}.part-{index}")
+        for index in range(len(ranges))
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _process_chunk,
+                    str(csv_path),
+                    fieldnames,
+                    start,
+                    end,
+                    str(part_path),
+                    dict(recording_ids),
+                    offsets,
+                )
+                for (start, end), part_path in zip(ranges, part_paths)
+            ]
+            summaries: List[_RowsSummary] = []
+            for future, (start, end), part_path in zip(futures, ranges, part_paths):
+                try:
+                    summaries.append(future.result())
+                except ValueError:
+                    # Workers number rows from 1 per chunk. Redo the first
+                    # failing chunk after the rows of the chunks before it,
+                    # so the error names the row of the whole file.
+                    _process_chunk(
+                        str(csv_path),
+                        fieldnames,
+                        start,
+                        end,
+                        str(part_path),
+                        recording_ids,
+                        offsets,
+                        1 + sum(summary[0] for summary in summaries),
+                    )
+                    raise
+
+        # Each worker checked its own chunk; verify ordering across chunk edges.
+        last_host: Optional[int] = None
+        for count, first_host, chunk_last_host in summaries:
+            if not count:
+                continue
+            if last_host is not None and first_host < last_host:
+                raise _order_error("vp1", first_host - offsets[0], last_host - offsets[0])
+            last_host = chunk_last_host
+
+        with output_path.open("wb") as fp_out:
+            for part_path in part_paths:
+                with part_path.open("rb") as fp_part:
+                    shutil.copyfileobj(fp_part, fp_out, _OUTPUT_BUFFER_SIZE)
+    finally:
+        for part_path in part_paths:
+            with contextlib.suppress(FileNotFoundError):
+                part_path.unlink()
 
 
 def main() -> None:
@@ -173,49 +678,18 @@ def main() -> None:
     output_path = args.output_path.resolve()
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    previous_world_ns: Dict[str, Optional[int]] = {device: None for device in _DEVICES}
-
-    with csv_path.open("r", encoding="utf-8", newline="") as fp_in, output_path.open(
-        "w", encoding="utf-8"
-    ) as fp_out:
-        reader = csv.DictReader(fp_in)
-        for idx, row in enumerate(reader, start=1):
-            if not row:
-                continue
-            try:
-                t_host_ns = int(row.get("t_host_ns") or row["timestamp_ns"])
-            except KeyError as exc:
-                raise KeyError(
-                    "Spalte 't_host_ns' fehlt in der CSV"
-                ) from exc
-            except ValueError as exc:
-                raise ValueError(
-                    f"Ungültiger t_host_ns in Zeile {idx}: {row.get('t_host_ns')}"
-                ) from exc
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    if workers > 1:
+        _align_parallel(csv_path, output_path, recording_ids, workers)
+        return
 
-            event_name = row.get("event") or ""
-            payload = _parse_payload(row.get("payload"))
-
-            vp_entries = {}
-            for device in _DEVICES:
-                t_world_ns = host_to_dev(t_host_ns, device)
-                _ensure_monotonic(previous_world_ns, device, t_world_ns)
-                vp_entries[device] = {
-                    "t_world_ns": t_world_ns,
-                    "rec_id": recording_ids[device],
-                }
-
-            record: Dict[str, object] = {
-                "event": event_name,
-                "t_host_ns": t_host_ns,
-                "vp1": vp_entries["vp1"],
-                "vp2": vp_entries["vp2"],
-            }
-            if payload is not None:
-                record["payload"] = payload
-
-            fp_out.write(json.dumps(record, ensure_ascii=False))
-            fp_out.write("\n")
+    with output_path.open("wb", buffering=_OUTPUT_BUFFER_SIZE) as fp_out:
+        if _pacsv is not None and _np is not None:
+            _align_batches(_iter_arrow_batches(csv_path), fp_out, recording_ids)
+        elif _pd is not None and _np is not None:
+            _align_batches(_iter_pandas_batches(csv_path), fp_out, recording_ids)
+        else:
+            _align_rows(csv_path, fp_out, recording_ids)
 
 
 if __name__ == "__main__":
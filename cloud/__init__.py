@@ -1,6 +1,13 @@
 """Cloud integration utilities."""
 
-from .client import AppendEventError, append_event
+from .client import (
+    AppendEventError,
+    append_event,
+    append_event_async,
+    append_events,
+    append_events_many,
+    flush_buffered_events,
+)
 from .config import CFG
 from .payload import ALLOWED_ACTIONS, build_cloud_payload
 
@@ -9,5 +16,9 @@ __all__ = [
     "AppendEventError",
     "CFG",
     "append_event",
+    "append_event_async",
+    "append_events",
+    "append_events_many",
     "build_cloud_payload",
+    "flush_buffered_events",
 ]
@@ -2,22 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
 import logging
 import os
+import random
+import threading
 import time
 from http import HTTPStatus
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Mapping, MutableMapping, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 import traceback
 
+from core.clock import utc_now_iso_ms
+
 try:  # pragma: no cover - optional dependency, exercised in tests via monkeypatching
     import requests
     from requests import Response
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except Exception:  # pragma: no cover - import side effects shouldn't break runtime
     requests = None  # type: ignore[assignment]
     Response = Any  # type: ignore[misc, assignment]
+    HTTPAdapter = None  # type: ignore[assignment, misc]
+    Retry = None  # type: ignore[assignment, misc]
+
+try:  # pragma: no cover - optional dependency for faster JSON encoding
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - json from the stdlib is used instead
+    _orjson = None
+
+try:  # pragma: no cover - optional dependency for multiplexed batch appends
+    import httpx
+except Exception:  # pragma: no cover - batch appends are unavailable without httpx
+    httpx = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - HTTP/2 support for httpx is an optional extra
+    import h2  # type: ignore  # noqa: F401
+except Exception:  # pragma: no cover - httpx falls back to HTTP/1.1
+    _HTTP2_AVAILABLE = False
+else:  # pragma: no cover - depends on the installed extras
+    _HTTP2_AVAILABLE = True
 
 
 log = logging.getLogger(__name__)
@@ -25,14 +54,28 @@ log = logging.getLogger(__name__)
 _APPEND_EVENT_URL_ENV = "SENDE_EVENTS_URL"
 _API_KEY_ENV = "SENDE_API_KEY"
 _TIMEOUT_ENV = "SENDE_TIMEOUT_SECONDS"
+_BATCH_WINDOW_ENV = "SENDE_BATCH_WINDOW_MS"
 
 _DEFAULT_TIMEOUT = 10.0
 _MAX_ATTEMPTS = 5
 _INITIAL_BACKOFF = 0.5
+# Like the former retry loop, every 5xx response is retried.
+_RETRY_STATUS_CODES = frozenset(range(500, 600))
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+_ASYNC_MAX_CONNECTIONS = 32
+_NDJSON_CONTENT_TYPE = "application/x-ndjson"
+_BUFFER_MAX_EVENTS = 20
+_BUFFER_MAX_PENDING = 1000
 
 # ``upsert`` is disabled explicitly to guarantee append-only semantics even if the
 # backend SDK or API happens to default to an upsert behaviour.
-_UPSERT_QUERY = {"upsert": "false"}
+_UPSERT_QUERY: Mapping[str, str] = MappingProxyType({"upsert": "false"})
+
+_STATIC_HEADERS: Dict[str, str] = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
 
 append_only_mode = True
 
@@ -52,17 +95,36 @@ else:  # pragma: no cover - only evaluated when requests is unavailable
 
 _session: Optional[_Session] = None
 
+if Retry is not None:
+
+    class _Retry(Retry):  # type: ignore[misc, valid-type]
+        """``Retry`` that also backs off before the first retry.
+
+        urllib3 retries the first failure immediately; waiting
+        ``backoff_factor`` there keeps the 0.5 s, 1 s, 2 s, 4 s schedule.
+        """
+
+        def get_backoff_time(self) -> float:
+            if len(self.history) != 1:
+                return super().get_backoff_time()
+            jitter = getattr(self, "backoff_jitter", 0.0)
+            return float(self.backoff_factor) + random.random() * jitter
+
 
 class AppendEventError(RuntimeError):
     """Raised when an event could not be appended after retries."""
 
 
+class _RetryableAppendError(AppendEventError):
+    """Append failed with a network error or 5xx; sending again may succeed."""
+
+
 def _log_payload_violation(payload: Mapping[str, Any], keys: set[str]) -> None:
     """Record payload validation failures to a local log file."""
 
     try:
         _PAYLOAD_VIOLATION_LOG.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+        timestamp = utc_now_iso_ms()
         stack = "".join(traceback.format_stack())
         with _PAYLOAD_VIOLATION_LOG.open("a", encoding="utf-8") as handle:
             handle.write(
@@ -105,10 +167,35 @@ def _get_session() -> _Session:
         raise RuntimeError("The 'requests' package is required to send events")
     global _session
     if _session is None:
-        _session = requests.Session()
+        session = requests.Session()
+        # Retries (including backoff and Retry-After) are handled by urllib3 on
+        # the pooled keep-alive connections; the Idempotency-Key header makes
+        # retried POSTs safe on the backend.
+        retry_options: Dict[str, Any] = dict(
+            total=_MAX_ATTEMPTS - 1,
+            backoff_factor=_INITIAL_BACKOFF,
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        try:  # urllib3>=2 can jitter the backoff to avoid synchronized retries
+            retry = _Retry(**retry_options, backoff_jitter=_INITIAL_BACKOFF)
+        except TypeError:  # pragma: no cover - urllib3<2
+            retry = _Retry(**retry_options)
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        _session = session
     return _session
 
 
+@functools.lru_cache(maxsize=1)
 def _get_timeout() -> float:
     value = os.environ.get(_TIMEOUT_ENV)
     if not value:
@@ -121,6 +208,22 @@ def _get_timeout() -> float:
     return max(0.0, timeout)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_batch_window() -> float:
+    """Return the coalescing window in seconds; ``0`` disables buffering."""
+
+    value = os.environ.get(_BATCH_WINDOW_ENV)
+    if not value:
+        return 0.0
+    try:
+        window_ms = float(value)
+    except ValueError:
+        log.warning("Invalid %s value '%s', buffering disabled", _BATCH_WINDOW_ENV, value)
+        return 0.0
+    return max(0.0, window_ms / 1000.0)
+
+
+@functools.lru_cache(maxsize=1)
 def _get_append_url() -> str:
     url = os.environ.get(_APPEND_EVENT_URL_ENV)
     if not url:
@@ -130,38 +233,48 @@ def _get_append_url() -> str:
     return url
 
 
-def _build_headers(idempotency_key: str) -> Dict[str, str]:
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Idempotency-Key": idempotency_key,
-    }
+@functools.lru_cache(maxsize=1)
+def _build_base_headers() -> Dict[str, str]:
     api_key = os.environ.get(_API_KEY_ENV)
-    if api_key:
-        headers.setdefault("apikey", api_key)
-        headers.setdefault("Authorization", f"Bearer {api_key}")
-    return headers
+    if not api_key:
+        return dict(_STATIC_HEADERS)
+    return _STATIC_HEADERS | {"apikey": api_key, "Authorization": f"Bearer {api_key}"}
+
+
+def _build_headers(idempotency_key: str) -> Dict[str, str]:
+    return _build_base_headers() | {"Idempotency-Key": idempotency_key}
+
+
+def reset_config_cache() -> None:
+    """Forget cached endpoint, timeout and API key settings.
+
+    The ``SENDE_*`` environment variables are read once on first use; call
+    this after changing them at runtime (e.g. in tests).
+    """
+
+    _get_timeout.cache_clear()
+    _get_batch_window.cache_clear()
+    _get_append_url.cache_clear()
+    _build_base_headers.cache_clear()
 
 
-def _send_request(url: str, payload: Mapping[str, Any], headers: Mapping[str, str]) -> Response:
+def _send_request(url: str, body: Dict[str, Any], headers: Dict[str, str]) -> Response:
+    # ``body`` and ``headers`` are fresh per-call dicts built by
+    # :func:`_prepare_append`, so they are passed through without copying.
     session = _get_session()
     return session.post(
         url,
-        json=dict(payload),
-        headers=dict(headers),
-        params=dict(_UPSERT_QUERY),
+        json=body,
+        headers=headers,
+        params=_UPSERT_QUERY,
         timeout=_get_timeout(),
     )
 
 
-def append_event(payload: Dict[str, Any], *, idempotency_key: str) -> None:
-    """Send *payload* to the append-only Sende endpoint with retries.
+_PreparedAppend = Tuple[str, Dict[str, Any], Dict[str, str], str]
 
-    The same *idempotency_key* is reused across retries so the backend can recognise
-    duplicates. HTTP 409 responses are considered a success (duplicate) and abort
-    further retries.
-    """
 
+def _prepare_append(payload: Mapping[str, Any], idempotency_key: str) -> _PreparedAppend:
     if not idempotency_key:
         raise ValueError("idempotency_key must be a non-empty string")
 
@@ -172,16 +285,267 @@ def append_event(payload: Dict[str, Any], *, idempotency_key: str) -> None:
 
     # Copy the payload so callers do not observe mutations and ensure the
     # idempotency key is recorded locally even if the backend ignores the header.
-    body: MutableMapping[str, Any] = dict(payload)
+    body: Dict[str, Any] = dict(payload)
     body.setdefault("client_idempotency_key", idempotency_key)
+    return append_url, body, headers, idempotency_key
+
+
+def _check_response(status: int, text: str, idempotency_key: str) -> None:
+    if status == HTTPStatus.CONFLICT:
+        log.debug(
+            "Duplicate event detected for %s (HTTP 409), treating as success",
+            idempotency_key,
+        )
+        return
+    if 200 <= status < 300:
+        return
+    message = f"Append for {idempotency_key} failed with status {status}: {text!r}"
+    if 400 <= status < 500:
+        raise AppendEventError(message)
+    log.warning(message)
+    raise _RetryableAppendError("Append-only request failed") from AppendEventError(message)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _send_bulk_request(url: str, body: bytes, headers: Dict[str, str]) -> Response:
+    session = _get_session()
+    return session.post(
+        url,
+        data=body,
+        headers=headers,
+        params=_UPSERT_QUERY,
+        timeout=_get_timeout(),
+    )
+
+
+class _FlushBuffer:
+    """Coalesce appends into NDJSON batches sent via :func:`append_events`.
+
+    A single daemon thread sends complete batches of ``max_events`` as soon
+    as they fill up and everything else once the batch window's monotonic
+    deadline expires. Batches are taken and sent under one lock, so they
+    reach the endpoint in order. Batches that failed with a network error or
+    5xx are requeued in front of newer events; beyond ``max_pending`` the
+    oldest events are dropped. Rejected batches (4xx, invalid events) are
+    logged and dropped. Both are counted in :attr:`dropped`.
+    """
+
+    def __init__(self, max_events: int, max_pending: int) -> None:
+        self._max_events = max_events
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._items: List[Tuple[Dict[str, Any], str]] = []
+        self._window = 0.0
+        # Monotonic deadline of the pending batch window, if one is armed.
+        self._deadline: Optional[float] = None
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    def add(self, payload: Dict[str, Any], idempotency_key: str, window: float) -> None:
+        with self._lock:
+            self._items.append((payload, idempotency_key))
+            self._window = window
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_flusher, name="SendeAppendFlusher", daemon=True
+                )
+                self._thread.start()
+            if len(self._items) >= self._max_events:
+                self._wake.set()
+            elif self._deadline is None:
+                self._deadline = time.monotonic() + window
+                self._wake.set()
+
+    def flush(self) -> None:
+        self._send_taken(None)
+
+    def _run_flusher(self) -> None:
+        size = self._max_events
+        # After a failed send, full batches also wait for the window instead
+        # of retrying in a tight loop.
+        retry_at = 0.0
+        while True:
+            self._wake.clear()
+            with self._lock:
+                queued = len(self._items)
+                deadline = self._deadline
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                count: Optional[int] = None
+            elif queued >= size and now >= retry_at:
+                # Only complete batches; the rest keeps waiting for the window.
+                count = queued - queued % size
+            elif deadline is None:
+                self._wake.wait()
+                continue
+            else:
+                self._wake.wait(deadline - now)
+                continue
+            if not self._send_taken(count):
+                retry_at = time.monotonic() + self._window
+
+    def _send_taken(self, count: Optional[int]) -> bool:
+        """Send the first *count* buffered events (all if ``None``)."""
+
+        with self._send_lock:
+            with self._lock:
+                if count is None:
+                    items, self._items = self._items, []
+                else:
+                    items, self._items = self._items[:count], self._items[count:]
+                if not self._items:
+                    self._deadline = None
+            size = self._max_events
+            for start in range(0, len(items), size):
+                batch = items[start : start + size]
+                try:
+                    append_events([item[0] for item in batch], [item[1] for item in batch])
+                except _RetryableAppendError:
+                    log.exception("Buffered append of %d events failed", len(batch))
+                    self._requeue_front(items[start:])
+                    return False
+                except Exception:
+                    # Sending the same batch again would fail the same way and
+                    # block every later event behind it.
+                    log.exception("Dropped %d buffered events rejected by append", len(batch))
+                    with self._lock:
+                        self.dropped += len(batch)
+        return True
+
+    def _requeue_front(self, items: List[Tuple[Dict[str, Any], str]]) -> None:
+        with self._lock:
+            self._items[:0] = items
+            overflow = len(self._items) - self._max_pending
+            if overflow > 0:
+                del self._items[:overflow]
+                self.dropped += overflow
+                log.warning(
+                    "Dropped %d buffered events after failed appends", overflow
+                )
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self._window
+            self._wake.set()
+
 
-    last_error: Optional[Exception] = None
-    delay = _INITIAL_BACKOFF
+_buffer = _FlushBuffer(_BUFFER_MAX_EVENTS, _BUFFER_MAX_PENDING)
+atexit.register(_buffer.flush)
 
+
+def flush_buffered_events() -> None:
+    """Send events held back by ``SENDE_BATCH_WINDOW_MS`` buffering now."""
+
+    _buffer.flush()
+
+
+def append_event(payload: Dict[str, Any], *, idempotency_key: str) -> None:
+    """Send *payload* to the append-only Sende endpoint with retries.
+
+    Network errors and 5xx responses are retried by the pooled session up to
+    four times, backing off 0.5 s, 1 s, 2 s and 4 s (or as ``Retry-After``
+    asks). The same *idempotency_key* is sent on every retry so
+    the backend can recognise duplicates. HTTP 409 responses are considered a
+    success (duplicate).
+
+    When ``SENDE_BATCH_WINDOW_MS`` is set, the validated event is buffered
+    instead and sent with others in one NDJSON request; failures of such
+    batches are logged rather than raised. After network errors and 5xx
+    responses the events are requeued for the next window; rejected batches
+    are dropped.
+
+    The ``SENDE_*`` settings are read on first use and cached for the rest of
+    the process; call :func:`reset_config_cache` after changing them.
+    """
+
+    window = _get_batch_window()
+    if window > 0:
+        if not idempotency_key:
+            raise ValueError("idempotency_key must be a non-empty string")
+        _ensure_minimal_payload(payload)
+        # Fail on the caller's thread rather than later in the flusher.
+        _get_append_url()
+        _buffer.add(dict(payload), idempotency_key, window)
+        return
+
+    append_url, body, headers, _ = _prepare_append(payload, idempotency_key)
+
+    try:
+        response = _send_request(append_url, body, headers)
+    except _RequestException as exc:  # pragma: no cover - exercised via tests
+        log.warning(
+            "Append for %s failed with network error: %s", idempotency_key, exc
+        )
+        raise _RetryableAppendError("Append-only request failed") from exc
+
+    _check_response(response.status_code, response.text, idempotency_key)
+
+
+def append_events(
+    events: Sequence[Dict[str, Any]], idempotency_keys: Sequence[str]
+) -> None:
+    """Send *events* to the append-only endpoint as a single NDJSON request.
+
+    Every event carries its own ``client_idempotency_key`` so the backend can
+    deduplicate per event. The request itself uses a batch key derived from
+    all event keys, so a retried batch is recognised as a whole.
+    """
+
+    if len(events) != len(idempotency_keys):
+        raise ValueError("Each event requires exactly one idempotency key")
+    if not events:
+        return
+
+    prepared = [
+        _prepare_append(payload, key) for payload, key in zip(events, idempotency_keys)
+    ]
+    append_url = prepared[0][0]
+    batch_key = "batch-" + hashlib.sha256(
+        "\n".join(idempotency_keys).encode("utf-8")
+    ).hexdigest()
+    headers = _build_headers(batch_key)
+    headers["Content-Type"] = _NDJSON_CONTENT_TYPE
+    body = b"".join(_dumps_bytes(item[1]) + b"\n" for item in prepared)
+
+    try:
+        response = _send_bulk_request(append_url, body, headers)
+    except _RequestException as exc:  # pragma: no cover - exercised via tests
+        log.warning("Append for %s failed with network error: %s", batch_key, exc)
+        raise _RetryableAppendError("Append-only request failed") from exc
+
+    _check_response(response.status_code, response.text, batch_key)
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    limits = httpx.Limits(
+        max_connections=_ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections=_ASYNC_MAX_CONNECTIONS,
+    )
+    return httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE, limits=limits, timeout=_get_timeout()
+    )
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff before retry *attempt* + 1."""
+
+    return _INITIAL_BACKOFF * (2**attempt) * random.uniform(0.5, 1.5)
+
+
+async def _post_async(client: "httpx.AsyncClient", prepared: _PreparedAppend) -> None:
+    append_url, body, headers, idempotency_key = prepared
+    last_error: Optional[BaseException] = None
     for attempt in range(_MAX_ATTEMPTS):
         try:
-            response = _send_request(append_url, body, headers)
-        except _RequestException as exc:  # pragma: no cover - exercised via tests
+            response = await client.post(
+                append_url, json=body, headers=headers, params=_UPSERT_QUERY
+            )
+        except httpx.HTTPError as exc:
             last_error = exc
             log.warning(
                 "Append attempt %d for %s failed with network error: %s",
@@ -191,36 +555,71 @@ def append_event(payload: Dict[str, Any], *, idempotency_key: str) -> None:
             )
         else:
             status = response.status_code
-            if status == HTTPStatus.CONFLICT:
-                log.debug(
-                    "Duplicate event detected for %s (HTTP 409), treating as success",
-                    idempotency_key,
-                )
-                return
-            if 200 <= status < 300:
+            if status not in _RETRY_STATUS_CODES:
+                _check_response(status, response.text, idempotency_key)
                 return
-            content = response.text
-            message = (
+            last_error = AppendEventError(
                 f"Append attempt {attempt + 1} for {idempotency_key} failed "
-                f"with status {status}: {content!r}"
+                f"with status {status}: {response.text!r}"
             )
-            if 400 <= status < 500:
-                raise AppendEventError(message)
-            last_error = AppendEventError(message)
-            log.warning(message)
-
-        if attempt >= _MAX_ATTEMPTS - 1:
-            break
-        time.sleep(delay)
-        delay *= 2
-
-    if last_error is None:
-        last_error = AppendEventError(
-            f"Failed to append event for {idempotency_key} after {_MAX_ATTEMPTS} attempts"
-        )
+            log.warning(str(last_error))
+        if attempt < _MAX_ATTEMPTS - 1:
+            await asyncio.sleep(_retry_delay(attempt))
     raise AppendEventError("Append-only request failed") from last_error
 
 
+async def append_event_async(
+    payload: Dict[str, Any],
+    *,
+    idempotency_key: str,
+    client: Optional["httpx.AsyncClient"] = None,
+) -> None:
+    """Asynchronous :func:`append_event` that never blocks the calling thread.
+
+    Retries back off with jittered exponential delays via :func:`asyncio.sleep`.
+    Pass *client* to reuse an existing ``httpx.AsyncClient`` and its
+    connections; otherwise a short-lived client is created.
+    """
+
+    if httpx is None:
+        raise RuntimeError("The 'httpx' package is required for asynchronous appends")
+    prepared = _prepare_append(payload, idempotency_key)
+    if client is not None:
+        await _post_async(client, prepared)
+        return
+    async with _get_async_client() as owned_client:
+        await _post_async(owned_client, prepared)
+
+
+async def _append_many_async(prepared: Sequence[_PreparedAppend]) -> None:
+    async with _get_async_client() as client:
+        results = await asyncio.gather(
+            *(_post_async(client, item) for item in prepared),
+            return_exceptions=True,
+        )
+    errors: List[BaseException] = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+
+
+def append_events_many(items: Sequence[Tuple[Dict[str, Any], str]]) -> None:
+    """Send several ``(payload, idempotency_key)`` pairs concurrently.
+
+    All requests share one ``httpx`` client so they are multiplexed as HTTP/2
+    streams over a single connection when the ``h2`` extra is installed. Every
+    payload is validated before anything is sent; the first failure is raised
+    after all requests have completed. Must not be called from a running event
+    loop.
+    """
+
+    if httpx is None:
+        raise RuntimeError("The 'httpx' package is required to send event batches")
+    prepared = [_prepare_append(payload, key) for payload, key in items]
+    if not prepared:
+        return
+    asyncio.run(_append_many_async(prepared))
+
+
 def update_event(*_args: Any, **_kwargs: Any) -> None:
     """No-op helper retained for backwards compatibility."""
 
@@ -247,9 +646,14 @@ def refine_event(*_args: Any, **_kwargs: Any) -> None:
 
 __all__ = [
     "append_event",
+    "append_event_async",
+    "append_events",
+    "append_events_many",
     "AppendEventError",
     "append_only_mode",
+    "flush_buffered_events",
     "refine_event",
+    "reset_config_cache",
     "update_event",
     "upsert_event",
 ]
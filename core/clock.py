@@ -47,5 +47,25 @@ class Clock:
         return cls._ns_to_datetime(monotonic_ns).astimezone().strftime(fmt)
 
 
-__all__ = ["Clock"]
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp.
+_utc_prefix_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso_ms() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SS.mmmZ``.
+
+    Equivalent to ``datetime.utcnow().isoformat(timespec="milliseconds") + "Z"``
+    but only formats the date and time once per second.
+    """
+
+    global _utc_prefix_cache
+    seconds, remainder = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _utc_prefix_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _utc_prefix_cache = (seconds, prefix)
+    return f"{prefix}.{remainder // 1_000_000:03d}Z"
+
+
+__all__ = ["Clock", "utc_now_iso_ms"]
 
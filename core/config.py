@@ -44,6 +44,8 @@ EVENT_BATCH_SIZE: Final[int] = _get_int("EVENT_BATCH_SIZE", 20)
 QC_RMS_NS_THRESHOLD: Final[int] = _get_int("QC_RMS_NS_THRESHOLD", 5_000)
 QC_CONFIDENCE_MIN: Final[float] = _get_float("QC_CONFIDENCE_MIN", 0.9)
 CLOUD_SESSION_ID_REQUIRED: Final[bool] = _get_bool("CLOUD_SESSION_ID_REQUIRED", False)
+# Re-run schema validation even for events that were validated already.
+EVENT_REVALIDATE: Final[bool] = _get_bool("EVENT_REVALIDATE", False)
 
 __all__ = [
     "LOW_LATENCY_DISABLED",
@@ -52,4 +54,5 @@ __all__ = [
     "QC_RMS_NS_THRESHOLD",
     "QC_CONFIDENCE_MIN",
     "CLOUD_SESSION_ID_REQUIRED",
+    "EVENT_REVALIDATE",
 ]
@@ -1,11 +1,19 @@
 """Event-related utilities."""
 
 from .cloud_client import CloudClient, Priority
-from .schema import BaseEvent, ALLOWED_ACTIONS, validate_base_event
+from .schema import (
+    BaseEvent,
+    ALLOWED_ACTIONS,
+    ValidatedBaseEvent,
+    is_prevalidated,
+    validate_base_event,
+)
 
 __all__ = [
     "BaseEvent",
     "ALLOWED_ACTIONS",
+    "ValidatedBaseEvent",
+    "is_prevalidated",
     "validate_base_event",
     "CloudClient",
     "Priority",
@@ -6,13 +6,19 @@ import json
 import logging
 import queue
 import threading
+import time
 from collections import deque
 from typing import Callable, Deque, Dict, Iterable, Literal, Mapping, MutableSequence, Tuple
 
+try:  # Optional dependency for faster batch serialisation.
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - json from the stdlib is used instead
+    _orjson = None
+
 from core.config import EVENT_BATCH_SIZE, EVENT_BATCH_WINDOW_MS
 
 from .error_logger import log_event_error, reason_from_exception
-from .schema import BaseEvent, validate_base_event
+from .schema import BaseEvent, is_prevalidated, validate_base_event
 
 Priority = Literal["high", "normal"]
 
@@ -30,18 +36,42 @@ _ALLOWED_FIELDS: tuple[str, ...] = (
     "mapping_version",
     "mapping_confidence",
 )
+_ALLOWED_SET: frozenset[str] = frozenset(_ALLOWED_FIELDS)
 
 
 _HIGH_SENTINEL = object()
-_HighQueueItem = tuple[Dict[str, object], Tuple[str, str], int | None]
+_HighQueueItem = tuple[bytes, Tuple[str, str], int | None]
+
+
+def _encode_event(event: Dict[str, object]) -> bytes:
+    """Serialise a single *event* as compact UTF-8 JSON."""
+
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(event)
+        except TypeError:  # pragma: no cover - e.g. integers beyond 64 bit
+            pass
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _join_batch(encoded: list[bytes]) -> bytes:
+    """Combine pre-encoded events into a JSON array without re-serialising."""
+
+    return b"[" + b",".join(encoded) + b"]"
 
 
 class CloudClient:
-    """Batch cloud events while respecting priority semantics."""
+    """Batch cloud events while respecting priority semantics.
+
+    *transport* receives each batch as UTF-8 encoded JSON array bytes.
+    Normal-priority events are flushed by a background thread once
+    *batch_size* events are queued or *batch_window_s* has elapsed,
+    whichever comes first.
+    """
 
     def __init__(
         self,
-        transport: Callable[[str], None],
+        transport: Callable[[bytes], None],
         *,
         batch_window_s: float | None = None,
         batch_size: int | None = None,
@@ -57,9 +87,18 @@ class CloudClient:
             default_batch_size if batch_size is None else max(1, int(batch_size))
         )
         self._lock = threading.Lock()
-        self._queue: Deque[Dict[str, object]] = deque()
-        self._timer: threading.Timer | None = None
+        # Events are encoded by the producer so flushing only joins bytes.
+        self._queue: Deque[bytes] = deque()
+        # Monotonic deadline of the pending batch window, if one is armed.
+        self._flush_deadline: float | None = None
+        self._flush_wake = threading.Event()
         self._closed = False
+        self._flush_thread = threading.Thread(
+            target=self._run_flusher,
+            name="CloudClientFlusher",
+            daemon=True,
+        )
+        self._flush_thread.start()
         self._high_queue: "queue.Queue[_HighQueueItem]" = queue.Queue()
         self._high_thread = threading.Thread(
             target=self._drain_high_priority_queue,
@@ -76,22 +115,28 @@ class CloudClient:
         if priority not in ("high", "normal"):
             raise ValueError(f"Unsupported priority: {priority}")
 
-        try:
-            validated = validate_base_event(payload)
-        except ValueError as exc:
-            log_event_error(reason_from_exception(exc), payload)
-            return
+        if is_prevalidated(payload):
+            validated = payload
+        else:
+            try:
+                validated = validate_base_event(payload)
+            except ValueError as exc:
+                log_event_error(reason_from_exception(exc), payload)
+                return
 
-        filtered: Dict[str, object] = {}
-        for key in _ALLOWED_FIELDS:
-            if key in validated:
-                value = validated[key]
-                if value is not None:
-                    filtered[key] = value
+        # ``validated`` follows the schema field order, so the whitelist order
+        # is preserved without probing every allowed key.
+        filtered: Dict[str, object] = {
+            key: value
+            for key, value in validated.items()
+            if key in _ALLOWED_SET and value is not None
+        }
 
         if not filtered:
             return
 
+        encoded = _encode_event(filtered)
+
         if priority == "high":
             key = (validated["session_id"], validated["actor"])
             sequence_obj = validated.get("sequence_no")  # type: ignore[assignment]
@@ -99,21 +144,19 @@ class CloudClient:
             with self._lock:
                 if self._closed:
                     return
-            self._high_queue.put((filtered, key, sequence_no))
+            self._high_queue.put((encoded, key, sequence_no))
             return
 
         with self._lock:
             if self._closed:
                 return
-            self._queue.append(filtered)
+            self._queue.append(encoded)
             if len(self._queue) >= self._batch_size:
-                batch = self._dequeue_locked(self._batch_size)
+                # Full batch: let the flusher send it now instead of waiting
+                # for the window to expire.
+                self._flush_wake.set()
             else:
                 self._schedule_timer_locked()
-                return
-
-        if batch:
-            self._send_batch(batch)
 
     # ------------------------------------------------------------------
     def flush(self) -> None:
@@ -121,8 +164,7 @@ class CloudClient:
 
         with self._lock:
             batch = self._dequeue_locked()
-        if batch:
-            self._send_batch(batch)
+        self._send_batches(batch)
 
     def close(self) -> None:
         """Flush remaining events and prevent further sends."""
@@ -130,63 +172,101 @@ class CloudClient:
         send_sentinel = False
         with self._lock:
             if self._closed:
-                batch: list[Dict[str, object]] = []
+                batch: list[bytes] = []
             else:
                 self._closed = True
-                if self._timer is not None:
-                    self._timer.cancel()
-                    self._timer = None
+                self._flush_deadline = None
                 batch = self._dequeue_locked(cancel_timer=False)
                 send_sentinel = True
-        if batch:
-            self._send_batch(batch)
+        self._flush_wake.set()
+        self._send_batches(batch)
         if send_sentinel:
+            if self._flush_thread is not threading.current_thread():
+                self._flush_thread.join()
             self._high_queue.put(_HIGH_SENTINEL)
             self._high_thread.join()
 
     # ------------------------------------------------------------------
     def _dequeue_locked(
         self, max_items: int | None = None, *, cancel_timer: bool = True
-    ) -> list[Dict[str, object]]:
-        items: list[Dict[str, object]] = []
+    ) -> list[bytes]:
+        items: list[bytes] = []
         while self._queue and (max_items is None or len(items) < max_items):
             items.append(self._queue.popleft())
-        if cancel_timer and not self._queue and self._timer is not None:
-            self._timer.cancel()
-            self._timer = None
+        if cancel_timer and not self._queue:
+            self._flush_deadline = None
         return items
 
     def _schedule_timer_locked(self) -> None:
-        if self._timer is not None:
+        if self._flush_deadline is not None:
             return
-        delay = max(0.0, self._batch_window)
-        timer = threading.Timer(delay, self._on_timer)
-        timer.daemon = True
-        self._timer = timer
-        timer.start()
+        self._flush_deadline = time.monotonic() + max(0.0, self._batch_window)
+        self._flush_wake.set()
+
+    def _run_flusher(self) -> None:
+        size = self._batch_size
+        # After a failed send, full batches also wait for the window instead
+        # of retrying in a tight loop.
+        retry_at = 0.0
+        while True:
+            self._flush_wake.clear()
+            with self._lock:
+                if self._closed:
+                    return
+                queued = len(self._queue)
+                if queued >= size and time.monotonic() >= retry_at:
+                    # Only complete batches; the rest keeps waiting for the window.
+                    batch = self._dequeue_locked(queued - queued % size)
+                else:
+                    batch = []
+                deadline = self._flush_deadline
+            if batch:
+                if not self._send_batches(batch):
+                    retry_at = time.monotonic() + self._batch_window
+                continue
+            if deadline is None:
+                self._flush_wake.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._flush_wake.wait(remaining)
+                continue
+            self._on_timer()
 
     def _on_timer(self) -> None:
-        batch: list[Dict[str, object]]
+        batch: list[bytes]
         with self._lock:
             if self._closed:
                 return
-            self._timer = None
+            self._flush_deadline = None
             batch = self._dequeue_locked(cancel_timer=False)
-        if batch:
-            self._send_batch(batch)
+        self._send_batches(batch)
+
+    def _send_batches(self, events: list[bytes]) -> bool:
+        size = self._batch_size
+        for start in range(0, len(events), size):
+            end = start + size
+            if not self._send_batch(events[start:end], events[end:]):
+                return False
+        return True
+
+    def _send_batch(self, batch: Iterable[bytes], unsent: Iterable[bytes] = ()) -> bool:
+        """Send *batch*; on failure it is requeued together with *unsent*."""
 
-    def _send_batch(self, batch: Iterable[Dict[str, object]]) -> None:
         events = list(batch)
         if not events:
-            return
-        payload = json.dumps(events, separators=(",", ":"), ensure_ascii=False)
+            return True
+        payload = _join_batch(events)
         try:
             self._transport(payload)
         except Exception:  # pragma: no cover - defensive logging
             log.exception("Cloud event transport failed for %d events", len(events))
+            events.extend(unsent)
             self._requeue_front(events)
+            return False
+        return True
 
-    def _requeue_front(self, events: MutableSequence[Dict[str, object]]) -> None:
+    def _requeue_front(self, events: MutableSequence[bytes]) -> None:
         if not events:
             return
         with self._lock:
@@ -194,8 +274,7 @@ class CloudClient:
                 return
             for event in reversed(events):
                 self._queue.appendleft(event)
-            if self._timer is None:
-                self._schedule_timer_locked()
+            self._schedule_timer_locked()
 
     def _drain_high_priority_queue(self) -> None:
         while True:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-import math
+import functools
+import io
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, TypedDict, cast
+from typing import Any, Callable, Dict, Mapping, Optional, TypedDict, cast
+
+from core.config import EVENT_REVALIDATE
 
 ALLOWED_ACTIONS = {
     "card_flip",
@@ -36,12 +39,29 @@ class BaseEvent(BaseEventRequired, total=False):
     t_utc_iso: Optional[str]
 
 
+class ValidatedBaseEvent(dict):  # type: ignore[type-arg]
+    """A :class:`BaseEvent` dict returned by :func:`validate_base_event`.
+
+    Event sinks accept instances without validating them again, so only add
+    fields after validation that the sinks tolerate (such as ``sequence_no``).
+    """
+
+    __slots__ = ()
+
+
+def is_prevalidated(payload: Mapping[str, Any]) -> bool:
+    """Return whether *payload* may skip :func:`validate_base_event`."""
+
+    return type(payload) is ValidatedBaseEvent and not EVENT_REVALIDATE
+
+
 @dataclass(frozen=True)
 class _FieldSpec:
     name: str
     expected_type: tuple[type[Any], ...]
     optional: bool = False
     allow_none: bool = False
+    length: Optional[tuple[int, int]] = None
 
 
 _REQUIRED_FIELD_SPECS = (
@@ -61,80 +81,159 @@ _OPTIONAL_FIELD_SPECS = (
     _FieldSpec("mapping_version", (int,), optional=True, allow_none=True),
     _FieldSpec("mapping_confidence", (float,), optional=True, allow_none=True),
     _FieldSpec("mapping_rms_ns", (int,), optional=True, allow_none=True),
-    _FieldSpec("t_utc_iso", (str,), optional=True, allow_none=True),
+    # Bounds cover "YYYY-MM-DDTHH:MM:SS" up to microseconds plus a "+HH:MM"
+    # offset, rejecting malformed stamps without parsing them. ISO stamps are
+    # ASCII, so the bounds hold in bytes as well as in characters.
+    _FieldSpec("t_utc_iso", (str,), optional=True, allow_none=True, length=(19, 32)),
 )
 
-_KNOWN_FIELDS = {spec.name for spec in (*_REQUIRED_FIELD_SPECS, *_OPTIONAL_FIELD_SPECS)}
-
-
-def _is_valid_int(value: Any) -> bool:
-    return isinstance(value, int) and not isinstance(value, bool)
+_KNOWN_FIELDS = frozenset(
+    spec.name for spec in (*_REQUIRED_FIELD_SPECS, *_OPTIONAL_FIELD_SPECS)
+)
 
 
-def _validate_number(value: Any, expected_types: tuple[type[Any], ...]) -> bool:
-    if float in expected_types:
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            return not (isinstance(value, float) and (math.isnan(value) or math.isinf(value)))
-    return isinstance(value, expected_types) and not isinstance(value, bool)
+_MISSING = object()
+
+
+_INF = float("inf")
+_NEG_INF = float("-inf")
+
+
+def _emit_type_check(src: io.StringIO, spec: _FieldSpec, indent: str) -> None:
+    # Exact ``type(value) is T`` comparisons cover the common case; the
+    # ``isinstance`` fallback only runs for subclasses and wrong types.
+    name = spec.name
+    suffix = " or None" if spec.allow_none else ""
+    if spec.expected_type == (int,):
+        message = f"Field '{name}' must be an int{suffix}"
+        src.write(
+            f"{indent}if type(value) is not int and (\n"
+            f"{indent}    not isinstance(value, int) or isinstance(value, bool)\n"
+            f"{indent}):\n"
+            f"{indent}    raise ValueError({message!r})\n"
+        )
+        return
+    if spec.optional and spec.expected_type == (float,):
+        message = f"Field '{name}' must be a finite float or None"
+        src.write(
+            f"{indent}if type(value) is float:\n"
+            f"{indent}    if value != value or value == _INF or value == _NEG_INF:\n"
+            f"{indent}        raise ValueError({message!r})\n"
+            f"{indent}elif type(value) is int or (\n"
+            f"{indent}    isinstance(value, (int, float)) and not isinstance(value, bool)\n"
+            f"{indent}):\n"
+            f"{indent}    value = float(value)\n"
+            f"{indent}    if value != value or value == _INF or value == _NEG_INF:\n"
+            f"{indent}        raise ValueError({message!r})\n"
+            f"{indent}else:\n"
+            f"{indent}    raise ValueError({message!r})\n"
+        )
+        return
+    message = f"Field '{name}' must be of type {spec.expected_type}{suffix}, got "
+    empty = f"Field '{name}' cannot be empty" + (" when provided" if spec.optional else "")
+    if spec.expected_type == (str,):
+        src.write(
+            f"{indent}if type(value) is not str and not isinstance(value, str):\n"
+            f"{indent}    raise ValueError({message!r} + type(value).__name__)\n"
+            f"{indent}if not value:\n"
+            f"{indent}    raise ValueError({empty!r})\n"
+        )
+        if spec.length is not None:
+            low, high = spec.length
+            bounds = f"Field '{name}' must be between {low} and {high} characters long"
+            src.write(
+                f"{indent}if not ({low} <= len(value) <= {high} and value.isascii()):\n"
+                f"{indent}    raise ValueError({bounds!r})\n"
+            )
+        return
+    src.write(
+        f"{indent}if not isinstance(value, _TYPES[{name!r}]):\n"
+        f"{indent}    raise ValueError({message!r} + type(value).__name__)\n"
+        f"{indent}if isinstance(value, str) and not value:\n"
+        f"{indent}    raise ValueError({empty!r})\n"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_validator(
+    required: tuple[_FieldSpec, ...],
+    optional: tuple[_FieldSpec, ...],
+    allowed_actions: frozenset[str],
+) -> Callable[[Mapping[str, Any]], BaseEvent]:
+    """Generate a straight-line validator for the given field specs.
+
+    Compiled validators are cached per schema, so each distinct combination of
+    specs and allowed actions is generated only once.
+    """
 
+    src = io.StringIO()
+    src.write("def validate_base_event(data):\n")
+    for index, spec in enumerate(required):
+        missing = f"Missing required field: {spec.name}"
+        src.write(
+            f"    value = data.get({spec.name!r}, _MISSING)\n"
+            f"    if value is _MISSING:\n"
+            f"        raise ValueError({missing!r})\n"
+        )
+        _emit_type_check(src, spec, "    ")
+        src.write(f"    field_{index} = value\n")
+    for index, spec in enumerate(required):
+        if spec.name == "action":
+            src.write(
+                f"    if field_{index} not in _ALLOWED_ACTIONS:\n"
+                f"        raise ValueError(f'Unsupported action: {{field_{index}}}')\n"
+            )
+    # A single dict display lets CPython allocate the table for all required
+    # fields up front instead of growing it key by key.
+    items = ", ".join(f"{spec.name!r}: field_{index}" for index, spec in enumerate(required))
+    src.write(f"    validated = _VALIDATED({{{items}}})\n")
+    for spec in optional:
+        src.write(
+            f"    value = data.get({spec.name!r}, _MISSING)\n"
+            f"    if value is not _MISSING:\n"
+            f"        if value is not None:\n"
+        )
+        _emit_type_check(src, spec, "            ")
+        src.write(f"        validated[{spec.name!r}] = value\n")
+    src.write(
+        # ``issuperset`` checks the keys without allocating; the difference
+        # is only materialised for the error message.
+        "    if not _KNOWN_FIELDS.issuperset(data):\n"
+        "        extra_fields = data.keys() - _KNOWN_FIELDS\n"
+        "        raise ValueError(f'Unexpected fields: {sorted(extra_fields)}')\n"
+        "    return validated\n"
+    )
+
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_VALIDATED": ValidatedBaseEvent,
+        "_ALLOWED_ACTIONS": allowed_actions,
+        "_KNOWN_FIELDS": frozenset(spec.name for spec in (*required, *optional)),
+        "_TYPES": {spec.name: spec.expected_type for spec in (*required, *optional)},
+        "_INF": _INF,
+        "_NEG_INF": _NEG_INF,
+    }
+    exec(src.getvalue(), namespace)
+    return cast(Callable[[Mapping[str, Any]], BaseEvent], namespace["validate_base_event"])
+
+
+# Validation results are deliberately not memoised: building a hashable key from the
+# payload costs more than running the generated checks, and live events
+# rarely repeat because ``t_ui_mono_ns`` differs on every call.
+validate_base_event = _compile_validator(
+    _REQUIRED_FIELD_SPECS, _OPTIONAL_FIELD_SPECS, frozenset(ALLOWED_ACTIONS)
+)
+validate_base_event.__doc__ = """Validate *data* and return it as a :class:`BaseEvent`.
 
-def validate_base_event(data: Mapping[str, Any]) -> BaseEvent:
-    """Validate *data* and return it as a :class:`BaseEvent`.
+Raises:
+    ValueError: If a required field is missing or if any field fails validation.
+"""
 
-    Raises:
-        ValueError: If a required field is missing or if any field fails validation.
-    """
 
-    validated: Dict[str, Any] = {}
-
-    for spec in _REQUIRED_FIELD_SPECS:
-        if spec.name not in data:
-            raise ValueError(f"Missing required field: {spec.name}")
-        value = data[spec.name]
-        if spec.expected_type == (int,):
-            if not _is_valid_int(value):
-                raise ValueError(f"Field '{spec.name}' must be an int")
-        else:
-            if not isinstance(value, spec.expected_type):
-                raise ValueError(
-                    f"Field '{spec.name}' must be of type {spec.expected_type}, got {type(value).__name__}"
-                )
-        if isinstance(value, str) and not value:
-            raise ValueError(f"Field '{spec.name}' cannot be empty")
-        validated[spec.name] = value
-
-    action = validated["action"]
-    if action not in ALLOWED_ACTIONS:
-        raise ValueError(f"Unsupported action: {action}")
-
-    for spec in _OPTIONAL_FIELD_SPECS:
-        if spec.name not in data:
-            continue
-        value = data[spec.name]
-        if value is None:
-            validated[spec.name] = None
-            continue
-        if spec.expected_type == (int,):
-            if not _is_valid_int(value):
-                raise ValueError(f"Field '{spec.name}' must be an int or None")
-        elif spec.expected_type == (float,):
-            if not _validate_number(value, spec.expected_type):
-                raise ValueError(f"Field '{spec.name}' must be a finite float or None")
-            value = float(value)
-        else:
-            if not isinstance(value, spec.expected_type):
-                raise ValueError(
-                    f"Field '{spec.name}' must be of type {spec.expected_type} or None, got {type(value).__name__}"
-                )
-            if isinstance(value, str) and not value:
-                raise ValueError(f"Field '{spec.name}' cannot be empty when provided")
-        validated[spec.name] = value
-
-    extra_fields = set(data.keys()) - _KNOWN_FIELDS
-    if extra_fields:
-        raise ValueError(f"Unexpected fields: {sorted(extra_fields)}")
-
-    return cast(BaseEvent, validated)
-
-
-__all__ = ["BaseEvent", "ALLOWED_ACTIONS", "validate_base_event"]
+__all__ = [
+    "BaseEvent",
+    "ALLOWED_ACTIONS",
+    "ValidatedBaseEvent",
+    "is_prevalidated",
+    "validate_base_event",
+]
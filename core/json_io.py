@@ -0,0 +1,53 @@
+"""JSON helpers for the analysis scripts, backed by orjson when installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Mapping
+
+try:  # Optional dependency for faster JSON parsing and serialisation.
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - json from the stdlib is used instead
+    _orjson = None
+
+__all__ = ["dumps", "is_mapping", "loads"]
+
+
+def loads(data: bytes | memoryview) -> Any:
+    """Parse one JSON document; errors are :class:`json.JSONDecodeError`."""
+
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # NaN/Infinity literals are only understood by the stdlib
+            # parser, which also produces the error message for real errors.
+            pass
+    return json.loads(bytes(data))
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 bytes, compact unless *indent* is set."""
+
+    if _orjson is not None:
+        option = (_orjson.OPT_INDENT_2 if indent else 0) | (
+            _orjson.OPT_SORT_KEYS if sort_keys else 0
+        )
+        try:
+            return _orjson.dumps(obj, option=option)
+        except TypeError:  # pragma: no cover - e.g. integers beyond 64 bit
+            pass
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    else:
+        text = json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+        )
+    return text.encode("utf-8")
+
+
+def is_mapping(value: object) -> bool:
+    """Return whether *value* is a mapping, checking plain dicts first."""
+
+    # Parsed JSON only contains plain dicts; the ABC check is the slow path.
+    return type(value) is dict or isinstance(value, Mapping)
@@ -2,14 +2,28 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Callable, Dict, Iterable, Mapping
+
+try:  # Optional dependency used for column-wise conversions.
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - numpy is optional at runtime
+    _np = None
+
+log = logging.getLogger(__name__)
 
 _VALID_DEVICES = {"vp1", "vp2"}
+_ALL_DEVICES = frozenset(_VALID_DEVICES)
+
+_HOST_TIME_KEYS = ("t_host_ns", "timestamp_ns")
+_DEVICE_TIME_KEYS = ("t_dev_ns", "t_device_ns", "timestamp_ns")
 
 # Location where offsets are persisted. This is relative to the project root.
-_OFFSETS_PATH = Path(__file__).resolve().parent.parent / "sync" / "offsets.json"
-_SYNC_POINTS_PATH = Path(__file__).resolve().parent.parent / "sync" / "sync_points.jsonl"
+_SYNC_DIR = Path(__file__).resolve().parent.parent / "sync"
+_OFFSETS_PATH = _SYNC_DIR / "offsets.json"
+_SYNC_POINTS_PATH = _SYNC_DIR / "sync_points.jsonl"
 
 
 def _load_offsets() -> Dict[str, int]:
@@ -22,17 +36,56 @@ def _load_offsets() -> Dict[str, int]:
     except json.JSONDecodeError as exc:  # pragma: no cover - invalid JSON should be rare
         raise ValueError(f"Invalid offsets file {_OFFSETS_PATH}: {exc}") from exc
 
-    return {device: int(offset) for device, offset in data.items()}
+    # Only known devices are kept, so a successful lookup in ``_offsets``
+    # implies a valid device and the hot path can skip the validation.
+    offsets: Dict[str, int] = {}
+    for device, offset in data.items():
+        if device in _VALID_DEVICES:
+            offsets[device] = int(offset)
+        else:
+            log.warning("Ignoring offset for unknown device %r in %s", device, _OFFSETS_PATH)
+    return offsets
 
 
 _offsets: Dict[str, int] = _load_offsets()
 
+# Callbacks invoked after offsets changed, e.g. to wake up the start gate.
+_listeners: list[Callable[[], None]] = []
+
+
+def add_offset_listener(callback: Callable[[], None]) -> None:
+    """Call *callback* whenever new offsets have been stored."""
+    _listeners.append(callback)
+
+
+def remove_offset_listener(callback: Callable[[], None]) -> None:
+    """Stop notifying *callback* about offset updates."""
+    try:
+        _listeners.remove(callback)
+    except ValueError:
+        pass
+
+
+def _notify_listeners() -> None:
+    # A failing listener must neither skip the others nor replace an exception
+    # raised by the caller (``capture_sync_point`` notifies from ``finally``).
+    for callback in tuple(_listeners):
+        try:
+            callback()
+        except Exception:
+            log.exception("Offset listener %r failed", callback)
+
 
 def _save_offsets() -> None:
-    """Persist current offsets to disk."""
+    """Persist current offsets to disk.
+
+    The file is replaced atomically so readers never observe a partial write.
+    """
     _OFFSETS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with _OFFSETS_PATH.open("w", encoding="utf-8") as f:
+    tmp_path = _OFFSETS_PATH.with_name(_OFFSETS_PATH.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
         json.dump(_offsets, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, _OFFSETS_PATH)
 
 
 def _validate_device(device: str) -> None:
@@ -47,6 +100,13 @@ def estimate_offset(sync_point: Dict[str, int]) -> None:
         sync_point: Dictionary containing host and device timestamps (in ns) and the
             device identifier ("vp1" or "vp2").
     """
+    _update_offset(sync_point)
+    _save_offsets()
+    _notify_listeners()
+
+
+def _update_offset(sync_point: Mapping[str, Any]) -> None:
+    """Store the offset described by *sync_point* without persisting it."""
     try:
         device = sync_point["device"]
         t_host_ns = int(sync_point["t_host_ns"])
@@ -59,23 +119,29 @@ def estimate_offset(sync_point: Dict[str, int]) -> None:
 
     offset = t_host_ns - t_dev_ns
     _offsets[device] = offset
-    _save_offsets()
 
 
 def have_offsets(devices: Iterable[str] | None = None) -> bool:
-    """Return ``True`` if offsets are known for *devices*."""
+    """Return ``True`` if offsets are known for *devices*.
 
-    required = tuple(devices) if devices is not None else tuple(_VALID_DEVICES)
-    return all(device in _offsets for device in required)
+    Callers checking repeatedly can pass a ``frozenset`` to skip the conversion.
+    """
+
+    if devices is None:
+        required = _ALL_DEVICES
+    elif isinstance(devices, (set, frozenset)):
+        required = devices
+    else:
+        required = frozenset(devices)
+    return _offsets.keys() >= required
 
 
 def _extract_int(mapping: Mapping[str, Any], *, keys: tuple[str, ...]) -> int:
     """Extract an integer value from ``mapping`` using the provided ``keys``."""
 
+    get = mapping.get
     for key in keys:
-        if key not in mapping:
-            continue
-        value = mapping[key]
+        value = get(key)
         if value is None:
             continue
         try:
@@ -90,18 +156,22 @@ def _extract_devices(event: Mapping[str, Any]) -> Mapping[str, Mapping[str, Any]
 
     candidates: list[Mapping[str, Any]] = []
 
+    # ``type(...) is dict`` short-circuits the common JSON-decoded case before
+    # the comparatively slow ABC check against ``Mapping``.
     devices = event.get("devices")
-    if isinstance(devices, Mapping):
+    if type(devices) is dict or isinstance(devices, Mapping):
         return devices  # type: ignore[return-value]
 
     payload = event.get("payload")
-    if isinstance(payload, Mapping):
+    if type(payload) is dict or isinstance(payload, Mapping):
         inner_devices = payload.get("devices")
-        if isinstance(inner_devices, Mapping):
+        if type(inner_devices) is dict or isinstance(inner_devices, Mapping):
             return inner_devices  # type: ignore[return-value]
         candidates.append(payload)
     elif isinstance(payload, list):
-        candidates.extend(item for item in payload if isinstance(item, Mapping))
+        candidates.extend(
+            item for item in payload if type(item) is dict or isinstance(item, Mapping)
+        )
 
     candidates.append(event)
 
@@ -132,57 +202,93 @@ def capture_sync_point(
         Dictionary containing the synchronisation data per device.
     """
 
-    t_host_ns = _extract_int(host_entry, keys=("t_host_ns", "timestamp_ns"))
+    t_host_ns = _extract_int(host_entry, keys=_HOST_TIME_KEYS)
 
     device_payloads = _extract_devices(neon_event)
 
     results: Dict[str, Dict[str, int]] = {}
     sync_points_for_log: dict[str, Dict[str, Any]] = {}
 
-    for device, payload in device_payloads.items():
-        _validate_device(device)
-        t_dev_ns = _extract_int(
-            payload, keys=("t_dev_ns", "t_device_ns", "timestamp_ns")
-        )
-        recording_id = payload.get("recording_id")
-
-        sync_point = {"device": device, "t_host_ns": t_host_ns, "t_dev_ns": t_dev_ns}
-        if recording_id is not None:
-            sync_point["recording_id"] = recording_id
-
-        estimate_offset(sync_point)
-
-        entry: Dict[str, int] = {"t_host_ns": t_host_ns, "t_dev_ns": t_dev_ns}
-        results[device] = entry
-        sync_points_for_log[device] = sync_point
-
+    # Offsets of all devices are persisted with a single write; devices updated
+    # before a failure are still saved, as with per-device persistence.
+    try:
+        for device, payload in device_payloads.items():
+            _validate_device(device)
+            t_dev_ns = _extract_int(payload, keys=_DEVICE_TIME_KEYS)
+            recording_id = payload.get("recording_id")
+
+            sync_point = {"device": device, "t_host_ns": t_host_ns, "t_dev_ns": t_dev_ns}
+            if recording_id is not None:
+                sync_point["recording_id"] = recording_id
+
+            _update_offset(sync_point)
+
+            entry: Dict[str, int] = {"t_host_ns": t_host_ns, "t_dev_ns": t_dev_ns}
+            results[device] = entry
+            sync_points_for_log[device] = sync_point
+    finally:
+        if sync_points_for_log:
+            _save_offsets()
+            _notify_listeners()
+
+    # The entry is serialised immediately, so plain dicts are logged as-is;
+    # only other Mapping types need converting for ``json``.
     log_entry = {
-        "host_event": dict(host_entry),
-        "neon_event": dict(neon_event),
+        "host_event": host_entry if type(host_entry) is dict else dict(host_entry),
+        "neon_event": neon_event if type(neon_event) is dict else dict(neon_event),
         "sync_points": sync_points_for_log,
     }
 
     _SYNC_POINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with _SYNC_POINTS_PATH.open("a", encoding="utf-8") as fp:
-        json.dump(log_entry, fp, ensure_ascii=False)
-        fp.write("\n")
+    line = json.dumps(log_entry, ensure_ascii=False).encode("utf-8") + b"\n"
+    with _SYNC_POINTS_PATH.open("ab") as fp:
+        fp.write(line)
 
     return results
 
 
+def get_offset_ns(device: str) -> int:
+    """Return the host-minus-device offset for *device* in nanoseconds.
+
+    Hot loops converting many timestamps can resolve the offset once and
+    apply it inline instead of calling :func:`host_to_dev` per value.
+    """
+    offset = _offsets.get(device)
+    if offset is None:
+        _validate_device(device)
+        raise KeyError(f"Offset for device '{device}' is not set.")
+    return offset
+
+
 def host_to_dev(t_host_ns: int, device: str) -> int:
     """Convert a host timestamp to device time."""
-    _validate_device(device)
-    if device not in _offsets:
-        raise KeyError(f"Offset for device '{device}' is not set.")
+    return int(t_host_ns) - get_offset_ns(device)
 
-    return int(t_host_ns) - _offsets[device]
+
+def host_to_dev_array(t_host_ns: Any, device: str) -> Any:
+    """Convert an array of host timestamps to device time.
+
+    The offset is resolved once for the whole column so callers processing
+    large exports avoid the per-value lookup of :func:`host_to_dev`.
+    """
+    if _np is None:
+        raise RuntimeError("The 'numpy' package is required for array conversions")
+    offset = get_offset_ns(device)
+    return _np.asarray(t_host_ns, dtype=_np.int64) - _np.int64(offset)
 
 
 def dev_to_host(t_dev_ns: int, device: str) -> int:
     """Convert a device timestamp to host time."""
-    _validate_device(device)
-    if device not in _offsets:
-        raise KeyError(f"Offset for device '{device}' is not set.")
+    return int(t_dev_ns) + get_offset_ns(device)
+
 
-    return int(t_dev_ns) + _offsets[device]
+def dev_to_host_array(t_dev_ns: Any, device: str) -> Any:
+    """Convert an array of device timestamps to host time.
+
+    Counterpart of :func:`host_to_dev_array`; the offset is applied to the
+    whole column in a single NumPy operation.
+    """
+    if _np is None:
+        raise RuntimeError("The 'numpy' package is required for array conversions")
+    offset = get_offset_ns(device)
+    return _np.asarray(t_dev_ns, dtype=_np.int64) + _np.int64(offset)
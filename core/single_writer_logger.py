@@ -14,15 +14,35 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import os
 import threading
 import time
 from collections import deque
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Optional
+
+try:  # Optional dependency for faster JSONL serialisation.
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - json from the stdlib is used instead
+    _orjson = None
 
 __all__ = ["SingleWriterLogger"]
 
+# Scatter-gather writes are only available on POSIX; elsewhere the JSONL file
+# falls back to a buffered handle.
+_HAS_WRITEV = hasattr(os, "writev")
+try:
+    _IOV_MAX = int(os.sysconf("SC_IOV_MAX"))
+except (AttributeError, ValueError, OSError):  # pragma: no cover - platform specific
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:  # pragma: no cover - sysconf reports -1 when unlimited
+    _IOV_MAX = 1024
+
+# ``json.dumps`` with non-default options builds a new encoder per call; the
+# encoder holds no per-call state, so producer threads can share one.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class SingleWriterLogger:
     """Write structured log events to disk using a single consumer thread.
@@ -64,7 +84,6 @@ class SingleWriterLogger:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._capacity = queue_size
         self._queue: deque[Any] = deque()
-        self._queue_size = 0
         self._lock = threading.Lock()
         self._not_empty = threading.Condition(self._lock)
         self._batch_size = batch_size
@@ -76,16 +95,25 @@ class SingleWriterLogger:
         self._written_events = 0
         self._high_watermark = max(1, int(queue_size * 0.8))
         self._low_watermark = max(1, int(queue_size * 0.6))
-        self._warned_backpressure = False
-        self._csv_writer: Optional[csv.DictWriter[str]] = None
-        self._csv_fieldnames: Optional[list[str]] = None
+        # Producers compare against a single threshold. After warning it is
+        # parked above the capacity so that it cannot trigger again until the
+        # consumer re-arms it below the low watermark.
+        self._warn_at = self._high_watermark
+        self._csv_writer: Optional[Any] = None
+        self._csv_fieldnames: Optional[tuple[str, ...]] = None
 
         suffix = self._path.suffix.lower()
         if suffix not in {".jsonl", ".csv"}:
             raise ValueError("SingleWriterLogger only supports .jsonl or .csv outputs")
         self._format = suffix.lstrip(".")
 
-        if self._format == "jsonl":
+        self._fd: Optional[int] = None
+        self._file: Optional[Any] = None
+        if self._format == "jsonl" and _HAS_WRITEV:
+            # Raw append descriptor: each batch becomes one ``writev`` call
+            # without first copying the event bytes into a joined buffer.
+            self._fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        elif self._format == "jsonl":
             self._file = self._path.open("ab")
         else:
             self._file = self._path.open("a", encoding="utf-8", newline="")
@@ -131,23 +159,30 @@ class SingleWriterLogger:
             raise TypeError("event must be a mapping")
 
         prepared = self._prepare_event(event)
+        queue = self._queue
         with self._not_empty:
-            if self._queue_size >= self._capacity:
+            queued = len(queue)
+            if queued >= self._capacity:
                 self._dropped_events += 1
                 return False
-            self._queue.append(prepared)
-            self._queue_size += 1
-            queued = self._queue_size
-            self._not_empty.notify()
+            queue.append(prepared)
+            if not queued:
+                # The consumer only waits on an empty queue, so waking it on the
+                # empty -> non-empty transition is sufficient.
+                self._not_empty.notify()
+            queued += 1
+
+        if queued >= self._warn_at:
+            self._warn_backpressure(queued)
 
-        if not self._warned_backpressure and queued >= self._high_watermark:
-            self._logger.warning(
-                "SingleWriterLogger queue utilisation high size=%d capacity=%d", queued, self._capacity
-            )
-            self._warned_backpressure = True
-        
         return True
 
+    def _warn_backpressure(self, queued: int) -> None:
+        self._warn_at = self._capacity + 1
+        self._logger.warning(
+            "SingleWriterLogger queue utilisation high size=%d capacity=%d", queued, self._capacity
+        )
+
     def close(self) -> None:
         """Flush pending events and stop the consumer thread."""
 
@@ -157,11 +192,13 @@ class SingleWriterLogger:
         self._stop_event.set()
         with self._not_empty:
             self._queue.append(self._SENTINEL)
-            self._queue_size += 1
             self._not_empty.notify()
         self._thread.join()
-        self._file.flush()
-        self._file.close()
+        if self._fd is not None:
+            os.close(self._fd)
+        else:
+            self._file.flush()
+            self._file.close()
         self._logger.info("SingleWriterLogger stopped DroppedEvents=%d", self._dropped_events)
 
     def __enter__(self) -> "SingleWriterLogger":
@@ -218,19 +255,20 @@ class SingleWriterLogger:
                     return items, sentinel_received, timed_out
                 self._not_empty.wait(remaining)
 
-            while self._queue and len(items) < max_items:
-                item = self._queue.popleft()
-                self._queue_size -= 1
-                if self._warned_backpressure and self._queue_size <= self._low_watermark:
-                    self._warned_backpressure = False
+            queue = self._queue
+            pop = queue.popleft
+            items = [pop() for _ in range(min(len(queue), max_items))]
+            if self._warn_at > self._capacity and len(queue) <= self._low_watermark:
+                self._warn_at = self._high_watermark
+
+        # The sentinel is only enqueued by ``close`` after the stop event is set,
+        # so the scan is skipped while the logger is running.
+        if self._stop_event.is_set():
+            for index, item in enumerate(items):
                 if item is self._SENTINEL:
                     sentinel_received = True
+                    del items[index:]
                     break
-                items.append(item)
-
-            if not items and not sentinel_received:
-                # If we exited because max_items == 0 we still honour timeout semantics.
-                timed_out = False
 
         return items, sentinel_received, timed_out
 
@@ -243,30 +281,60 @@ class SingleWriterLogger:
     def _prepare_jsonl_event(self, event: Mapping[str, Any]) -> bytes:
         if not isinstance(event, Mapping):
             raise TypeError("event must be a mapping")
-        return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        if _orjson is not None:
+            try:
+                return _orjson.dumps(event, option=_orjson.OPT_APPEND_NEWLINE)
+            except TypeError:  # pragma: no cover - e.g. non-str keys or big integers
+                pass
+        return (_JSON_ENCODER.encode(event) + "\n").encode("utf-8")
 
     def _write_jsonl(self, batch: list[bytes]) -> None:
         if not batch:
             return
-        self._file.write(b"".join(batch))
+        if self._fd is not None:
+            for start in range(0, len(batch), _IOV_MAX):
+                self._writev_all(batch[start : start + _IOV_MAX])
+        else:
+            # ``writelines`` hands each chunk to the buffered writer directly,
+            # avoiding the intermediate copy made by ``b"".join``.
+            self._file.writelines(batch)
         self._written_events += len(batch)
 
-    def _prepare_csv_event(self, event: Mapping[str, Any]) -> Mapping[str, Any]:
+    def _writev_all(self, chunks: list[Any]) -> None:
+        fd = self._fd
+        remaining = sum(map(len, chunks))
+        while True:
+            written = os.writev(fd, chunks)
+            remaining -= written
+            if remaining <= 0:
+                return
+            # Partial write: skip the fully written chunks and trim the next one.
+            index = 0
+            while written >= len(chunks[index]):
+                written -= len(chunks[index])
+                index += 1
+            chunks = chunks[index:]
+            chunks[0] = memoryview(chunks[0])[written:]
+
+    def _prepare_csv_event(self, event: Mapping[str, Any]) -> list[Any]:
+        # The first event fixes the CSV columns; every row is then flattened
+        # to a positional list on the producer thread so the consumer only
+        # has to hand whole batches to ``csv.writer``.
         if not isinstance(event, Mapping):
             raise TypeError("event must be a mapping")
-        return dict(event)
-
-    def _write_csv(self, batch: Iterable[Mapping[str, Any]]) -> None:
+        fieldnames = self._csv_fieldnames
+        if fieldnames is None:
+            with self._lock:
+                if self._csv_fieldnames is None:
+                    self._csv_fieldnames = tuple(event.keys())
+                fieldnames = self._csv_fieldnames
+        get = event.get
+        return [get(key, "") for key in fieldnames]
+
+    def _write_csv(self, batch: list[list[Any]]) -> None:
         if self._csv_writer is None:
-            first = next(iter(batch))
-            if not isinstance(first, Mapping):
-                raise TypeError("CSV logging requires mapping events")
-            self._csv_fieldnames = list(first.keys())
-            self._csv_writer = csv.DictWriter(self._file, fieldnames=self._csv_fieldnames, extrasaction="ignore")
-            self._csv_writer.writeheader()
-
-        assert self._csv_writer is not None
-
-        for item in batch:
-            self._csv_writer.writerow({key: item.get(key, "") for key in self._csv_fieldnames or ()})
-            self._written_events += 1
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(self._csv_fieldnames or ())
+
+        self._csv_writer.writerows(batch)
+        self._written_events += len(batch)
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any, Dict, Mapping, MutableMapping
 
@@ -16,6 +15,7 @@ from core.config import (
     EVENT_BATCH_WINDOW_MS,
     LOW_LATENCY_DISABLED,
 )
+from core.json_io import dumps
 
 log = logging.getLogger(__name__)
 
@@ -92,7 +92,7 @@ def gather_diagnostics() -> Dict[str, Any]:
     if flags.get("merge", {}).get("effective"):
         log.warning("Suspicious flag detected: merge enabled")
     data: Dict[str, Any] = {
-        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "sdk_version": sdk_version or "unknown",
         "append_only_mode": append_only_mode,
         "sdk_flags": flags,
@@ -110,8 +110,7 @@ def write_reports(data: Mapping[str, Any], directory: Path = _DIAGNOSTIC_DIR) ->
     json_path = directory / "cloud_env.json"
     txt_path = directory / "cloud_env.txt"
 
-    with json_path.open("w", encoding="utf-8") as fp:
-        json.dump(data, fp, ensure_ascii=False, indent=2, sort_keys=True)
+    json_path.write_bytes(dumps(data, indent=True, sort_keys=True))
 
     lines = [
         f"Timestamp: {data.get('timestamp', 'unknown')}",
@@ -135,7 +134,10 @@ def write_reports(data: Mapping[str, Any], directory: Path = _DIAGNOSTIC_DIR) ->
 
     lines.append("")
     lines.append("Projekt- und Pipeline-Flags:")
-    for name, value in sorted(_collect_project_flags().items()):
+    project_flags = data.get("project_flags")
+    if not isinstance(project_flags, Mapping):
+        project_flags = _collect_project_flags()
+    for name, value in sorted(project_flags.items()):
         lines.append(f"  - {name}={value}")
 
     firmware = data.get("firmware_versions", {})
@@ -147,8 +149,8 @@ def write_reports(data: Mapping[str, Any], directory: Path = _DIAGNOSTIC_DIR) ->
     else:
         lines.append("  - keine Angaben")
 
-    with txt_path.open("w", encoding="utf-8") as fp:
-        fp.write("\n".join(lines) + "\n")
+    lines.append("")
+    txt_path.write_bytes("\n".join(lines).encode("utf-8"))
 
     return json_path, txt_path
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import array
 import csv
 import math
 import statistics
@@ -11,6 +12,11 @@ from typing import Iterable, Mapping, MutableSequence, Sequence
 
 from tabletop.logging.policy import is_critical_event
 
+try:  # pragma: no cover - optional dependency
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - numpy is optional at runtime
+    _np = None
+
 __all__ = ["emit_mapping_summary", "emit_latency_summary"]
 
 
@@ -59,6 +65,13 @@ _ACK_KEYS: tuple[str, ...] = (
     "ack_ns",
 )
 
+# Key -> (slot, priority): slot 0 holds the send and slot 1 the ack timestamp;
+# lower priorities win, matching the order of the tuples above.
+_TIMESTAMP_KEY_RANKS: Mapping[str, tuple[int, int]] = {
+    **{key: (0, rank) for rank, key in enumerate(_HOST_SEND_KEYS)},
+    **{key: (1, rank) for rank, key in enumerate(_ACK_KEYS)},
+}
+
 
 def emit_mapping_summary(
     session_id: str,
@@ -80,16 +93,16 @@ def emit_mapping_summary(
         fieldnames=_MAPPING_FIELDS,
     )
 
-    events_list = list(events)
-    total_events = len(events_list)
-    mapping_versions: list[int] = []
+    total_events = 0
+    max_version: int | None = None
     rms_values: list[float] = []
     with_device = 0
 
-    for entry in events_list:
+    for entry in events:
+        total_events += 1
         version = _coerce_int(entry.get("mapping_version"))
-        if version is not None:
-            mapping_versions.append(version)
+        if version is not None and (max_version is None or version > max_version):
+            max_version = version
 
         rms = _coerce_number(entry.get("mapping_rms_ns"))
         if rms is not None:
@@ -102,7 +115,7 @@ def emit_mapping_summary(
     avg_rms_ns = (
         int(round(statistics.mean(rms_values))) if rms_values else ""
     )
-    mapping_version = max(mapping_versions) if mapping_versions else ""
+    mapping_version = max_version if max_version is not None else ""
 
     share_with = _format_ratio(with_device, total_events)
     share_without = _format_ratio(without_device, total_events)
@@ -143,7 +156,7 @@ def emit_latency_summary(
         fieldnames=_LATENCY_FIELDS,
     )
 
-    latencies: list[float] = []
+    latencies = array.array("d")
     critical_events = 0
 
     for entry in events:
@@ -154,8 +167,7 @@ def emit_latency_summary(
 
         latency_value = _coerce_number(entry.get("latency_ns"))
         if latency_value is None:
-            send_ns = _extract_timestamp(entry, _HOST_SEND_KEYS)
-            ack_ns = _extract_timestamp(entry, _ACK_KEYS)
+            send_ns, ack_ns = _extract_send_ack(entry)
             if send_ns is not None and ack_ns is not None:
                 latency_candidate = ack_ns - send_ns
                 if latency_candidate >= 0:
@@ -164,12 +176,21 @@ def emit_latency_summary(
             continue
         latencies.append(float(latency_value))
 
-    median_latency = (
-        int(round(statistics.median(latencies))) if latencies else ""
-    )
-    p95_latency = (
-        int(round(_percentile(latencies, 0.95))) if latencies else ""
-    )
+    median_latency: int | str = ""
+    p95_latency: int | str = ""
+    if latencies:
+        median_value = p95_value = math.nan
+        if _np is not None:
+            median_value, p95_value = _np.percentile(
+                _np.frombuffer(latencies, dtype=_np.float64), (50, 95)
+            )
+        # NaN samples poison NumPy's result; the sorted fallback keeps the
+        # historical output for such sessions.
+        if math.isnan(median_value) or math.isnan(p95_value):
+            median_value = statistics.median(latencies)
+            p95_value = _percentile(latencies, 0.95)
+        median_latency = int(round(median_value))
+        p95_latency = int(round(p95_value))
 
     row = {
         "session_id": session_id,
@@ -184,14 +205,24 @@ def emit_latency_summary(
 
 
 def _append_row(config: _SummaryConfig, row: Mapping[str, object]) -> None:
+    _append_rows(config, (row,))
+
+
+def _append_rows(config: _SummaryConfig, rows: Iterable[Mapping[str, object]]) -> None:
+    """Append *rows* to the summary CSV, writing the header for a new file.
+
+    Callers producing many summaries should collect the rows and append them
+    in one call instead of reopening the file per row.
+    """
+
     config.output_dir.mkdir(parents=True, exist_ok=True)
     path = config.path
     needs_header = not path.exists()
-    with path.open("a", encoding="utf-8", newline="") as handle:
+    with path.open("a", encoding="utf-8", newline="", buffering=1 << 16) as handle:
         writer = csv.DictWriter(handle, fieldnames=config.fieldnames)
         if needs_header:
             writer.writeheader()
-        writer.writerow(row)
+        writer.writerows(rows)
 
 
 def _coerce_int(value: object) -> int | None:
@@ -217,15 +248,23 @@ def _format_ratio(numerator: int, denominator: int) -> str:
     return f"{numerator / denominator:.3f}"
 
 
-def _extract_timestamp(
-    entry: Mapping[str, object], keys: Sequence[str]
-) -> int | None:
-    for key in keys:
-        candidate = entry.get(key)
-        coerced = _coerce_int(candidate)
+def _extract_send_ack(entry: Mapping[str, object]) -> tuple[int | None, int | None]:
+    """Return the highest-priority send and ack timestamps in one pass."""
+
+    found: list[int | None] = [None, None]
+    best = [len(_HOST_SEND_KEYS), len(_ACK_KEYS)]
+    for key, value in entry.items():
+        slot = _TIMESTAMP_KEY_RANKS.get(key)
+        if slot is None:
+            continue
+        index, rank = slot
+        if rank >= best[index]:
+            continue
+        coerced = _coerce_int(value)
         if coerced is not None:
-            return coerced
-    return None
+            found[index] = coerced
+            best[index] = rank
+    return found[0], found[1]
 
 
 def _percentile(values: Sequence[float], fraction: float) -> float:
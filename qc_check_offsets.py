@@ -10,19 +10,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, Mapping, MutableMapping, Optional
 
+from core.json_io import dumps, is_mapping, loads
+
 
 _DEVICES = ("vp1", "vp2")
 _THRESHOLD_MS = 15.0
 
 
-@dataclass
+@dataclass(slots=True)
 class _SyncPoint:
     index: int
-    raw: Mapping[str, object]
     host_event: Optional[Mapping[str, object]]
     offsets_ns: Dict[str, Optional[int]]
 
@@ -68,15 +71,30 @@ def _parse_args() -> argparse.Namespace:
 
 
 def _load_json_lines(path: Path) -> Iterable[Mapping[str, object]]:
-    with path.open("r", encoding="utf-8") as fp:
-        for line_no, line in enumerate(fp, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                yield json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Ungültiges JSON in {path} Zeile {line_no}: {exc}") from exc
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return
+        # Lines are sliced straight out of the mapping, so even long session
+        # logs are never held in memory as a whole.
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            start = 0
+            line_no = 0
+            while start < size:
+                end = data.find(b"\n", start)
+                if end < 0:
+                    end = size
+                line_no += 1
+                stripped = data[start:end].strip()
+                start = end + 1
+                if not stripped:
+                    continue
+                try:
+                    yield loads(stripped)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(
+                        f"Ungültiges JSON in {path} Zeile {line_no}: {exc}"
+                    ) from exc
 
 
 def _ensure_index(name: str, value: int, total: int) -> int:
@@ -90,12 +108,12 @@ def _ensure_index(name: str, value: int, total: int) -> int:
 def _extract_offsets(sync_point: Mapping[str, object]) -> Dict[str, Optional[int]]:
     offsets: Dict[str, Optional[int]] = {}
     devices = sync_point.get("sync_points")
-    if not isinstance(devices, Mapping):
+    if not is_mapping(devices):
         raise KeyError("Eintrag enthält keine 'sync_points'")
 
     for device in _DEVICES:
         payload = devices.get(device)
-        if not isinstance(payload, Mapping):
+        if not is_mapping(payload):
             offsets[device] = None
             continue
         try:
@@ -115,9 +133,9 @@ def _load_sync_points(path: Path) -> list[_SyncPoint]:
     entries: list[_SyncPoint] = []
     for idx, entry in enumerate(_load_json_lines(path), start=1):
         host_event = entry.get("host_event")
-        host_mapping = host_event if isinstance(host_event, Mapping) else None
+        host_mapping = host_event if is_mapping(host_event) else None
         offsets = _extract_offsets(entry)
-        entries.append(_SyncPoint(index=idx, raw=entry, host_event=host_mapping, offsets_ns=offsets))
+        entries.append(_SyncPoint(index=idx, host_event=host_mapping, offsets_ns=offsets))
     if not entries:
         raise ValueError(f"Keine Sync-Punkte in {path} gefunden")
     return entries
@@ -193,6 +211,9 @@ def main() -> None:
         for device, value in deltas.items():
             if value is None:
                 continue
+            # The threshold is checked on the exact delta; the report keeps
+            # the rounded value, so round in place once it has been checked.
+            deltas[device] = round(value, 3)
             if abs(value) > _THRESHOLD_MS:
                 message = (
                     f"Offset-Drift über Schwellwert für {device} "
@@ -203,7 +224,7 @@ def main() -> None:
                     {
                         "label": comp["label"],
                         "device": device,
-                        "delta_offset_ms": round(value, 3),
+                        "delta_offset_ms": deltas[device],
                         "index": comp["index"],
                         "event": comp["event"],
                     }
@@ -216,26 +237,14 @@ def main() -> None:
         "threshold_ms": _THRESHOLD_MS,
         "delta_offset_ms_vp1": None if delta_offset_ms_vp1 is None else round(delta_offset_ms_vp1, 3),
         "delta_offset_ms_vp2": None if delta_offset_ms_vp2 is None else round(delta_offset_ms_vp2, 3),
-        "comparisons": [
-            {
-                "label": comp["label"],
-                "index": comp["index"],
-                "event": comp["event"],
-                "delta_offset_ms": {
-                    device: (None if value is None else round(value, 3))
-                    for device, value in comp["delta_offset_ms"].items()
-                },
-            }
-            for comp in comparisons
-        ],
+        "comparisons": comparisons,
         "warnings": warnings,
         "anomalies": anomalies,
     }
 
     output_path = args.output_path.resolve()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as fp:
-        json.dump(report, fp, indent=2, ensure_ascii=False)
+    output_path.write_bytes(dumps(report, indent=True))
 
 
 if __name__ == "__main__":
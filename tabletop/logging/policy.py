@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Final
 
 from core.events import Priority
-from tabletop.utils.runtime import is_low_latency_disabled
+from tabletop.utils import runtime as _runtime
 
 __all__ = [
     "CRITICAL_ACTIONS",
@@ -25,18 +25,27 @@ CRITICAL_ACTIONS: Final[frozenset[str]] = frozenset(
 )
 
 
-def _normalise_action(action: str | None) -> str:
-    if not action:
-        return ""
-    return action.strip().lower()
+# (epoch, value) of the last ``is_low_latency_disabled()`` lookup; refreshed
+# whenever :func:`tabletop.utils.runtime.reload_runtime_flags` bumps the epoch.
+_low_latency_cache: list[object] = [-1, False]
+
+
+def _low_latency_disabled() -> bool:
+    epoch = _runtime.runtime_config_epoch()
+    cache = _low_latency_cache
+    if cache[0] != epoch:
+        cache[1] = _runtime.is_low_latency_disabled()
+        cache[0] = epoch
+    return cache[1]  # type: ignore[return-value]
 
 
 def is_critical_event(action: str) -> bool:
     """Return ``True`` for actions that require low-latency handling."""
 
-    if is_low_latency_disabled():
+    if not action or _low_latency_disabled():
         return False
-    return _normalise_action(action) in CRITICAL_ACTIONS
+    # Most callers already pass canonical names; only normalise on a miss.
+    return action in CRITICAL_ACTIONS or action.strip().lower() in CRITICAL_ACTIONS
 
 
 def event_priority_for_action(action: str) -> Priority:
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import logging
+import queue
 import sqlite3
+import string
 import threading
 from contextlib import suppress
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from core.events import BaseEvent, CloudClient, Priority, validate_base_event
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, TextIO
+
+from core.clock import utc_now_iso_ms
+from core.events import (
+    BaseEvent,
+    CloudClient,
+    Priority,
+    ValidatedBaseEvent,
+    is_prevalidated,
+    validate_base_event,
+)
 from core.events.error_logger import log_event_error, reason_from_exception
 from core.single_writer_logger import SingleWriterLogger
 
@@ -54,29 +65,97 @@ _COLUMN_TYPES = {
 }
 
 _SQL_COLUMNS = ", ".join(_CSV_FIELDS)
+# Migrations for databases created before a column existed.
+_ADD_COLUMN_SQL = {
+    column: f"ALTER TABLE ui_events ADD COLUMN {column} {column_type}"
+    for column, column_type in _COLUMN_TYPES.items()
+}
 _SQL_PLACEHOLDERS = ", ".join("?" for _ in _CSV_FIELDS)
+_INSERT_SQL = f"INSERT INTO ui_events ({_SQL_COLUMNS}) VALUES ({_SQL_PLACEHOLDERS})"
+# Rows are committed in batches, matching the CSV logger's batching.
+_SQLITE_BATCH_SIZE = 32
+_SQLITE_FLUSH_INTERVAL = 0.05
 _MAPPING_WARNINGS_PATH = Path("logs/mapping_warnings.log")
+_LABEL_ALLOWED = frozenset(string.ascii_letters + string.digits + "-_")
+_LABEL_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if chr(code) not in _LABEL_ALLOWED}
+)
+
+
+def _compile_row_builders(
+    fields: tuple[str, ...],
+) -> tuple[
+    Callable[[Mapping[str, Any]], tuple[Any, ...]],
+    Callable[[tuple[Any, ...]], Dict[str, Any]],
+]:
+    """Generate straight-line builders for the SQLite values and CSV row.
+
+    The column layout is fixed at import time, so the per-field loop is
+    unrolled once instead of being interpreted for every logged event.
+    """
+
+    getters = ", ".join(f"get({name!r})" for name in fields)
+    cells = ", ".join(
+        f"{name!r}: '' if values[{index}] is None else values[{index}]"
+        for index, name in enumerate(fields)
+    )
+    src = (
+        "def extract_values(payload):\n"
+        "    get = payload.get\n"
+        f"    return ({getters},)\n"
+        "\n"
+        "def csv_row(values):\n"
+        f"    return {{{cells}}}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["extract_values"], namespace["csv_row"]
+
+
+_extract_values, _csv_row = _compile_row_builders(_CSV_FIELDS)
+_mapping_warnings_handle: Optional[TextIO] = None
+_mapping_warnings_lock = threading.Lock()
 
 
 def log_mapping_warning(message: str) -> None:
     """Append *message* to the mapping warnings log with a UTC timestamp."""
 
+    global _mapping_warnings_handle
     try:
-        _MAPPING_WARNINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
-        with _MAPPING_WARNINGS_PATH.open("a", encoding="utf-8") as handle:
-            handle.write(f"{timestamp} {message}\n")
+        timestamp = utc_now_iso_ms()
+        with _mapping_warnings_lock:
+            if _mapping_warnings_handle is None:
+                _MAPPING_WARNINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+                # Line buffered: each warning reaches the file without reopening it.
+                _mapping_warnings_handle = _MAPPING_WARNINGS_PATH.open(
+                    "a", encoding="utf-8", buffering=1
+                )
+            _mapping_warnings_handle.write(f"{timestamp} {message}\n")
     except Exception:  # pragma: no cover - best effort logging
         log.debug("Failed to record mapping warning", exc_info=True)
 
 
+@atexit.register
+def _close_mapping_warnings() -> None:
+    global _mapping_warnings_handle
+    with _mapping_warnings_lock:
+        if _mapping_warnings_handle is not None:
+            with suppress(Exception):
+                _mapping_warnings_handle.close()
+            _mapping_warnings_handle = None
+
+
 class UIEventLocalLogger:
     """Persist UI base events to CSV and SQLite backends."""
 
     def __init__(self, log_dir: Path, session_label: str) -> None:
-        safe_label = "".join(
-            ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in session_label
-        )
+        if session_label.isascii():
+            safe_label = session_label.translate(_LABEL_TABLE)
+        else:
+            # Unicode letters and digits are kept, like ``str.isalnum`` decides.
+            safe_label = "".join(
+                ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in session_label
+            )
         if not safe_label:
             safe_label = "session"
 
@@ -119,50 +198,82 @@ class UIEventLocalLogger:
             )
             self._ensure_schema_locked()
             self._conn.commit()
+        self._pending: list[tuple[object, ...]] = []
         self._closed = False
+        self._stop_flusher = threading.Event()
+        # Set by ``log`` when the first row becomes pending, so an idle
+        # flusher sleeps instead of polling.
+        self._flush_wake = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._run_flusher,
+            name="UIEventSQLiteFlusher",
+            daemon=True,
+        )
+        self._flush_thread.start()
 
     def log(self, payload: BaseEvent) -> None:
         if self._closed:
             raise RuntimeError("Cannot log UI events after logger has been closed")
 
-        csv_row = {
-            key: ("" if payload.get(key) is None else payload.get(key))
-            for key in _CSV_FIELDS
-        }
+        values = _extract_values(payload)
+        csv_row = _csv_row(values)
         sequence_no = payload.get("sequence_no")
         if sequence_no is not None:
             csv_row["sequence_no"] = sequence_no
         self._csv_logger.log_event(csv_row)
 
-        values = tuple(payload.get(key) for key in _CSV_FIELDS)
         with self._lock:
-            self._conn.execute(
-                f"INSERT INTO ui_events ({_SQL_COLUMNS}) VALUES ({_SQL_PLACEHOLDERS})",
-                values,
-            )
-            self._conn.commit()
+            self._pending.append(values)
+            if len(self._pending) >= _SQLITE_BATCH_SIZE:
+                self._flush_locked()
+            elif len(self._pending) == 1:
+                self._flush_wake.set()
 
     def close(self) -> None:
         if self._closed:
             return
         self._closed = True
+        self._stop_flusher.set()
+        self._flush_wake.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
         with suppress(Exception):
             self._csv_logger.close()
         with self._lock:
             with suppress(Exception):
+                self._flush_locked()
                 self._conn.commit()
                 self._conn.close()
 
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        self._conn.executemany(_INSERT_SQL, rows)
+        self._conn.commit()
+
+    def _run_flusher(self) -> None:
+        while True:
+            self._flush_wake.wait()
+            # Collect rows for one interval; ``close`` flushes what is left.
+            if self._stop_flusher.wait(_SQLITE_FLUSH_INTERVAL):
+                return
+            with self._lock:
+                self._flush_wake.clear()
+                try:
+                    self._flush_locked()
+                except Exception:  # pragma: no cover - defensive logging
+                    log.exception("Failed to write UI events to SQLite")
+
     def _ensure_schema_locked(self) -> None:
         cur = self._conn.cursor()
         cur.execute("PRAGMA table_info(ui_events)")
         existing = {row[1] for row in cur.fetchall()}
-        for column, column_type in _COLUMN_TYPES.items():
-            if column in existing:
-                continue
-            self._conn.execute(
-                f"ALTER TABLE ui_events ADD COLUMN {column} {column_type}"
-            )
+        if existing.issuperset(_ADD_COLUMN_SQL):
+            return
+        for column, statement in _ADD_COLUMN_SQL.items():
+            if column not in existing:
+                self._conn.execute(statement)
 
 
 class UIEventSender:
@@ -176,21 +287,43 @@ class UIEventSender:
     ) -> None:
         self._local_logger = local_logger
         self._cloud_client = cloud_client
+        # Cloud sends may block on network IO; a worker keeps them off the
+        # calling (UI) thread while preserving the dispatch order.
+        self._outbox: "queue.SimpleQueue[Optional[tuple[BaseEvent, Priority]]]" = (
+            queue.SimpleQueue()
+        )
+        self._cloud_thread: Optional[threading.Thread] = None
+        if cloud_client is not None:
+            self._cloud_thread = threading.Thread(
+                target=self._drain_outbox,
+                args=(cloud_client,),
+                name="UIEventCloudSender",
+                daemon=True,
+            )
+            self._cloud_thread.start()
+        # Only guards creating a counter; ``next()`` on an ``itertools.count``
+        # is a single C call and needs no lock of its own.
         self._sequence_lock = threading.Lock()
-        self._sequence_counters: dict[tuple[str, str], int] = {}
+        self._sequence_counters: dict[tuple[str, str], Iterator[int]] = {}
 
     def send_event(self, payload: BaseEvent, priority: Priority = "normal") -> None:
-        try:
-            validated = validate_base_event(payload)
-        except ValueError as exc:
-            log_event_error(reason_from_exception(exc), payload)
-            log.warning("UI event payload failed validation: %s", exc)
-            return
-
-        with self._sequence_lock:
-            key = (validated["session_id"], validated["actor"])
-            next_sequence = self._sequence_counters.get(key, 0) + 1
-            self._sequence_counters[key] = next_sequence
+        if is_prevalidated(payload):
+            # Copy: the sequence number below must not leak into the caller's event.
+            validated = ValidatedBaseEvent(payload)
+        else:
+            try:
+                validated = validate_base_event(payload)
+            except ValueError as exc:
+                log_event_error(reason_from_exception(exc), payload)
+                log.warning("UI event payload failed validation: %s", exc)
+                return
+
+        key = (validated["session_id"], validated["actor"])
+        counter = self._sequence_counters.get(key)
+        if counter is None:
+            with self._sequence_lock:
+                counter = self._sequence_counters.setdefault(key, itertools.count(1))
+        next_sequence = next(counter)
 
         validated["sequence_no"] = next_sequence  # type: ignore[assignment]
 
@@ -200,13 +333,26 @@ class UIEventSender:
             except Exception:
                 log.exception("Failed to persist UI event locally")
 
-        if self._cloud_client is not None:
+        if self._cloud_thread is not None:
+            self._outbox.put((validated, priority))
+
+    def _drain_outbox(self, cloud_client: CloudClient) -> None:
+        while True:
+            item = self._outbox.get()
+            if item is None:
+                return
+            payload, priority = item
             try:
-                self._cloud_client.send_event(validated, priority=priority)
+                cloud_client.send_event(payload, priority=priority)
             except Exception:
                 log.exception("Failed to forward UI event to cloud client")
 
     def close(self) -> None:
+        if self._cloud_thread is not None:
+            self._outbox.put(None)
+            if self._cloud_thread is not threading.current_thread():
+                self._cloud_thread.join()
+            self._cloud_thread = None
         if self._cloud_client is not None:
             with suppress(Exception):
                 self._cloud_client.close()
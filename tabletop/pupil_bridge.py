@@ -12,7 +12,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Literal, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Literal, Optional, Union
 
 from core.capabilities import CapabilityRegistry, DeviceCapabilities
 from core.clock import Clock
@@ -283,6 +283,7 @@ class PupilBridge:
         self._recording_controllers: Dict[str, RecordingController] = {}
         self._active_router_player: Optional[str] = None
         self._player_device_id: Dict[str, str] = {}
+        self._state_listeners: list[Callable[[], None]] = []
         self._async_loop = asyncio.new_event_loop()
         self._async_thread = threading.Thread(
             target=self._async_loop.run_forever,
@@ -307,6 +308,28 @@ class PupilBridge:
             )
             self._sender_thread.start()
 
+    # ---------------------------------------------------------------------
+    # State change notifications
+    def add_state_listener(self, callback: Callable[[], None]) -> None:
+        """Call *callback* whenever connection or recording state changes."""
+
+        self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable[[], None]) -> None:
+        """Stop notifying *callback* about state changes."""
+
+        try:
+            self._state_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_state_change(self) -> None:
+        for callback in tuple(self._state_listeners):
+            try:
+                callback()
+            except Exception:  # pragma: no cover - defensive
+                log.debug("State listener failed", exc_info=True)
+
     # ---------------------------------------------------------------------
     # Lifecycle management
     def connect(self) -> bool:
@@ -529,6 +552,7 @@ class PupilBridge:
             "event": "auto_start",
             "recording_id": None,
         }
+        self._notify_state_change()
 
     def _on_device_connected(
         self,
@@ -550,6 +574,7 @@ class PupilBridge:
             player, device, cfg
         )
         self._probe_capabilities(player, cfg, device_id)
+        self._notify_state_change()
 
     def _setup_time_sync(self, player: str, device_id: str, device: Any) -> None:
         async def measure(samples: int, timeout: float) -> list[float]:
@@ -1133,6 +1158,7 @@ class PupilBridge:
         }
         self._active_recording[player] = True
         self._recording_metadata[player] = payload
+        self._notify_state_change()
         if recording_id:
             log.info("recording.begin bestätigt (%s, id=%s)", player, recording_id)
         self.send_event("session.recording_started", player, payload)
@@ -1425,6 +1451,7 @@ class PupilBridge:
             metadata["recording_id"] = recording_id
         else:
             self._pending_recording_ids[player] = recording_id
+        self._notify_state_change()
 
     def _extract_recording_id(self, info: Any) -> Optional[str]:
         if isinstance(info, dict):
@@ -1547,6 +1574,7 @@ class PupilBridge:
         if player in self._active_recording:
             self._active_recording[player] = False
         self._recording_metadata.pop(player, None)
+        self._notify_state_change()
 
     def connected_players(self) -> list[str]:
         """Return the players that currently have a connected device."""
@@ -4,15 +4,32 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Callable, Optional, Sequence, Set, Tuple
+from typing import Callable, Optional, Sequence, Tuple
 
 from core import offset_sync
 
 __all__ = ["StartGate"]
 
+# Bit flags for the individual start conditions; ``_BLOCKER_NAMES`` is sorted
+# by name so log messages keep their order.
+_BLOCK_SENSORS = 1
+_BLOCK_RECORDING = 2
+_BLOCK_SYNC = 4
+_BLOCKER_NAMES: Tuple[Tuple[int, str], ...] = (
+    (_BLOCK_RECORDING, "recording"),
+    (_BLOCK_SENSORS, "sensors"),
+    (_BLOCK_SYNC, "sync_point"),
+)
+
 
 class StartGate:
-    """Poll device readiness until all start conditions are met."""
+    """Wait for device readiness until all start conditions are met.
+
+    Conditions are re-evaluated whenever :meth:`notify` is called (the bridge
+    and :mod:`core.offset_sync` do so on state changes) and otherwise every
+    *poll_interval* seconds, which still covers sensor state that is only
+    available by polling.
+    """
 
     DEFAULT_SENSORS: Tuple[str, ...] = (
         "world",
@@ -37,25 +54,38 @@ class StartGate:
         self._sensors = tuple(sensors or self.DEFAULT_SENSORS)
         self._poll_interval = max(0.1, float(poll_interval))
         self._log = logger or logging.getLogger(__name__)
-        self._offset_devices = tuple(offset_devices or ("vp1", "vp2"))
+        # An empty selection falls back to the defaults, so this is never empty.
+        self._offset_devices = frozenset(offset_devices or ("vp1", "vp2"))
         self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._subscribed = False
         self._thread: Optional[threading.Thread] = None
         self._callback: Optional[Callable[[], None]] = None
-        self._last_blockers: Set[str] = set()
+        self._last_blockers = 0
+        self._get_snapshot: Optional[Callable[[str], object]] = None
+        self._is_connected: Optional[Callable[[str], object]] = None
+        self._get_recording_id: Optional[Callable[[str], object]] = None
 
     @property
     def required_sensors(self) -> Tuple[str, ...]:
         return self._sensors
 
+    def notify(self) -> None:
+        """Re-evaluate the start conditions without waiting for the next poll."""
+
+        self._wake.set()
+
     def start(self, on_ready: Callable[[], None]) -> None:
-        """Start polling and invoke *on_ready* once all checks pass."""
+        """Start waiting and invoke *on_ready* once all checks pass."""
 
         if on_ready is None:
             raise ValueError("on_ready callback is required")
         self._callback = on_ready
+        self._bind_bridge()
         self._stop.clear()
         if self._thread and self._thread.is_alive():
             return
+        self._subscribe()
         self._thread = threading.Thread(target=self._run, name="StartGate", daemon=True)
         self._thread.start()
 
@@ -63,23 +93,56 @@ class StartGate:
         """Stop polling and wait for the worker thread to finish."""
 
         self._stop.set()
+        self._wake.set()
+        self._unsubscribe()
         thread = self._thread
         if thread and thread.is_alive() and threading.current_thread() is not thread:
             thread.join(timeout=0.5)
         self._thread = None
 
     # ------------------------------------------------------------------
+    def _bind_bridge(self) -> None:
+        bridge = self._bridge
+        getter = getattr(bridge, "get_sensor_snapshot", None)
+        is_connected = getattr(bridge, "is_connected", None)
+        recording_getter = getattr(bridge, "get_recording_id", None)
+        self._get_snapshot = getter if callable(getter) else None
+        self._is_connected = is_connected if callable(is_connected) else None
+        self._get_recording_id = recording_getter if callable(recording_getter) else None
+
+    def _subscribe(self) -> None:
+        if self._subscribed:
+            return
+        self._subscribed = True
+        offset_sync.add_offset_listener(self.notify)
+        add_listener = getattr(self._bridge, "add_state_listener", None)
+        if callable(add_listener):
+            add_listener(self.notify)
+
+    def _unsubscribe(self) -> None:
+        if not self._subscribed:
+            return
+        self._subscribed = False
+        offset_sync.remove_offset_listener(self.notify)
+        remove_listener = getattr(self._bridge, "remove_state_listener", None)
+        if callable(remove_listener):
+            remove_listener(self.notify)
+
     def _run(self) -> None:
         while not self._stop.is_set():
-            blockers = self._evaluate_blockers()
+            blockers = self._blocker_mask()
             if not blockers:
                 self._dispatch_ready()
                 return
             if blockers != self._last_blockers:
-                reasons = ", ".join(sorted(blockers)) or "-"
+                # Names are only materialised when the set of blockers changed.
+                reasons = ", ".join(
+                    name for flag, name in _BLOCKER_NAMES if blockers & flag
+                )
                 self._log.info("START-GATE waiting: %s", reasons)
                 self._last_blockers = blockers
-            self._stop.wait(self._poll_interval)
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
 
     def _dispatch_ready(self) -> None:
         callback = self._callback
@@ -93,37 +156,36 @@ class StartGate:
             self._callback = None
             self.stop()
 
-    def _evaluate_blockers(self) -> Set[str]:
-        blockers: Set[str] = set()
+    def _blocker_mask(self) -> int:
         if not self._players:
-            return blockers
+            return 0
+        mask = 0
         if not self._sensors_ready():
-            blockers.add("sensors")
+            mask |= _BLOCK_SENSORS
         if not self._recordings_ready():
-            blockers.add("recording")
+            mask |= _BLOCK_RECORDING
         if not self._sync_ready():
-            blockers.add("sync_point")
-        return blockers
+            mask |= _BLOCK_SYNC
+        return mask
 
     def _sensors_ready(self) -> bool:
-        bridge = self._bridge
-        getter = getattr(bridge, "get_sensor_snapshot", None)
-        is_connected = getattr(bridge, "is_connected", None)
-        if not callable(getter):
+        getter = self._get_snapshot
+        is_connected = self._is_connected
+        if getter is None:
             return False
+        required = self._sensors
         for player in self._players:
-            if callable(is_connected) and not is_connected(player):
+            if is_connected is not None and not is_connected(player):
                 return False
             snapshot = getter(player) or {}
-            for sensor in self._sensors:
-                if not snapshot.get(sensor, False):
-                    return False
+            get = snapshot.get
+            if not all(get(sensor) for sensor in required):
+                return False
         return True
 
     def _recordings_ready(self) -> bool:
-        bridge = self._bridge
-        getter = getattr(bridge, "get_recording_id", None)
-        if not callable(getter):
+        getter = self._get_recording_id
+        if getter is None:
             return False
         for player in self._players:
             recording_id = getter(player)
@@ -132,8 +194,5 @@ class StartGate:
         return True
 
     def _sync_ready(self) -> bool:
-        required = self._offset_devices or ()
-        if not required:
-            return True
-        return offset_sync.have_offsets(required)
+        return offset_sync.have_offsets(self._offset_devices)
 
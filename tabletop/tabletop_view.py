@@ -8,7 +8,6 @@ import random
 import time
 import uuid
 from contextlib import suppress
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
 
@@ -28,6 +27,7 @@ from kivy.uix.textinput import TextInput
 from cloud import client as cloud_client
 from cloud.config import CFG as CLOUD_CFG
 from cloud.payload import build_cloud_payload
+from core.clock import utc_now_iso_ms
 from core.config import CLOUD_SESSION_ID_REQUIRED
 from core.events import BaseEvent, Priority
 from tabletop.data.blocks import load_blocks, load_csv_rounds, value_to_card_path
@@ -673,7 +673,7 @@ class TabletopRoot(FloatLayout):
 
     def _enrich_ui_event(self, payload: BaseEvent) -> BaseEvent:
         enriched: Dict[str, Any] = dict(payload)
-        enriched["t_utc_iso"] = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+        enriched["t_utc_iso"] = utc_now_iso_ms()
         for key, value in self._compute_device_time_fields(enriched).items():
             enriched[key] = value
         return cast(BaseEvent, enriched)
@@ -9,6 +9,10 @@ _PERF_ENVS = ("PERF_LOGGING", "TABLETOP_PERF")
 _BATCH_WINDOW_ENV = "EVENT_BATCH_WINDOW_MS"
 _BATCH_SIZE_ENV = "EVENT_BATCH_SIZE"
 
+# Bumped by :func:`reload_runtime_flags` so callers caching the flags above
+# know when to re-read the environment.
+_runtime_epoch = 0
+
 
 def is_low_latency_disabled() -> bool:
     """Return ``True`` when the low-latency pipeline is disabled."""
@@ -19,6 +23,19 @@ def is_low_latency_disabled() -> bool:
     return False
 
 
+def runtime_config_epoch() -> int:
+    """Return a counter that changes whenever runtime flags are reloaded."""
+
+    return _runtime_epoch
+
+
+def reload_runtime_flags() -> None:
+    """Invalidate cached runtime flags after the environment changed."""
+
+    global _runtime_epoch
+    _runtime_epoch += 1
+
+
 def is_perf_logging_enabled() -> bool:
     """Return whether verbose performance logging is requested."""
 
@@ -65,4 +82,6 @@ __all__ = [
     "is_perf_logging_enabled",
     "event_batch_size_override",
     "event_batch_window_override",
+    "reload_runtime_flags",
+    "runtime_config_epoch",
 ]
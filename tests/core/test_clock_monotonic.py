@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 import pytest
 
-from core.clock import Clock
+from core import clock
+from core.clock import Clock, utc_now_iso_ms
 
 
 def test_clock_now_ns_is_monotonic() -> None:
@@ -26,3 +29,16 @@ def test_clock_now_ns_advances() -> None:
         pytest.fail("Clock did not advance within the expected iterations")
 
     assert second - first > 0
+
+
+def test_utc_now_iso_ms_matches_datetime_format(monkeypatch) -> None:
+    ns = 1_700_000_000_123_456_789
+    monkeypatch.setattr(clock.time, "time_ns", lambda: ns)
+    monkeypatch.setattr(clock, "_utc_prefix_cache", (-1, ""))
+
+    expected = datetime.fromtimestamp(ns // 1_000_000_000, timezone.utc)
+    expected = expected.replace(microsecond=123_456, tzinfo=None)
+    assert utc_now_iso_ms() == expected.isoformat(timespec="milliseconds") + "Z"
+
+    ns += 500_000_000
+    assert utc_now_iso_ms() == "2023-11-14T22:13:20.623Z"
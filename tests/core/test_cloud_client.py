@@ -1,11 +1,15 @@
 import csv
-import json
 import threading
 import time
-from pathlib import Path
-from typing import List
+from collections import deque
+from typing import Deque
 
-from core.events import CloudClient
+from core.events import CloudClient, error_logger
+
+try:  # Batches are plain JSON, so the faster parser is used when available.
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads as _loads
 
 
 def _base_event(**overrides):
@@ -24,24 +28,26 @@ def _base_event(**overrides):
 
 class _TransportSpy:
     def __init__(self) -> None:
-        self.calls: List[str] = []
-        self.threads: List[str] = []
-        self._lock = threading.Lock()
+        # ``deque.append`` is atomic, so recording needs no lock.
+        self.calls: Deque[bytes] = deque()
+        self.threads: Deque[str] = deque()
+        self._called = threading.Event()
 
-    def __call__(self, payload: str) -> None:
-        with self._lock:
-            self.calls.append(payload)
-            self.threads.append(threading.current_thread().name)
+    def __call__(self, payload: bytes) -> None:
+        assert isinstance(payload, bytes)
+        self.calls.append(payload)
+        self.threads.append(threading.current_thread().name)
+        self._called.set()
 
 
 def _wait_for_calls(spy: _TransportSpy, expected: int, timeout: float = 0.5) -> None:
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        with spy._lock:
-            if len(spy.calls) >= expected:
-                return
-        time.sleep(0.005)
-    raise AssertionError(f"Timed out waiting for {expected} transport calls")
+    while len(spy.calls) < expected:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise AssertionError(f"Timed out waiting for {expected} transport calls")
+        spy._called.wait(remaining)
+        spy._called.clear()
 
 
 def test_high_priority_triggers_immediate_send():
@@ -50,7 +56,7 @@ def test_high_priority_triggers_immediate_send():
     try:
         client.send_event(_base_event(trial_idx=5), priority="high")
         _wait_for_calls(spy, 1)
-        sent = json.loads(spy.calls[0])
+        sent = _loads(spy.calls[0])
         assert len(sent) == 1
         assert sent[0]["trial_idx"] == 5
     finally:
@@ -63,15 +69,30 @@ def test_normal_priority_batches_after_window():
     try:
         client.send_event(_base_event(trial_idx=2))
         client.send_event(_base_event(trial_idx=3))
-        assert spy.calls == []
-        time.sleep(0.08)
+        assert not spy.calls
+        _wait_for_calls(spy, 1)
         assert len(spy.calls) == 1
-        payload = json.loads(spy.calls[0])
+        payload = _loads(spy.calls[0])
         assert [item["trial_idx"] for item in payload] == [2, 3]
     finally:
         client.close()
 
 
+def test_full_normal_batch_sent_without_waiting_for_window():
+    spy = _TransportSpy()
+    client = CloudClient(spy, batch_window_s=5.0, batch_size=2)
+    try:
+        for idx in range(5):
+            client.send_event(_base_event(trial_idx=idx))
+        _wait_for_calls(spy, 2)
+        batches = [[item["trial_idx"] for item in _loads(call)] for call in spy.calls]
+        assert batches == [[0, 1], [2, 3]]
+        assert set(spy.threads) == {"CloudClientFlusher"}
+    finally:
+        client.close()
+    assert _loads(spy.calls[-1]) == [_base_event(trial_idx=4)]
+
+
 def test_payload_limited_to_whitelist_fields():
     spy = _TransportSpy()
     client = CloudClient(spy, batch_window_s=0.5, batch_size=5)
@@ -89,7 +110,7 @@ def test_payload_limited_to_whitelist_fields():
             priority="high",
         )
         _wait_for_calls(spy, 1)
-        sent = json.loads(spy.calls[0])[0]
+        sent = _loads(spy.calls[0])[0]
         assert set(sent.keys()) == {
             "session_id",
             "block_idx",
@@ -108,10 +129,9 @@ def test_payload_limited_to_whitelist_fields():
         client.close()
 
 
-def test_invalid_event_logged_and_not_sent():
-    error_log = Path("logs/event_errors.csv")
-    if error_log.exists():
-        error_log.unlink()
+def test_invalid_event_logged_and_not_sent(tmp_path, monkeypatch):
+    error_log = tmp_path / "event_errors.csv"
+    monkeypatch.setattr(error_logger, "_ERROR_LOG_PATH", error_log)
     spy = _TransportSpy()
     client = CloudClient(spy, batch_window_s=0.05, batch_size=5)
     try:
@@ -125,8 +145,9 @@ def test_invalid_event_logged_and_not_sent():
                 "t_ui_mono_ns": 42,
             }
         )
-        time.sleep(0.02)
-        assert spy.calls == []
+        # Anything that had been queued would be sent by an explicit flush.
+        client.flush()
+        assert not spy.calls
     finally:
         client.close()
 
@@ -157,7 +178,7 @@ def test_high_priority_events_preserve_order_and_thread():
 
         _wait_for_calls(spy, total)
 
-        payloads = [json.loads(call)[0]["trial_idx"] for call in spy.calls]
+        payloads = [_loads(call)[0]["trial_idx"] for call in spy.calls]
         assert payloads == list(range(total))
         assert len(set(spy.threads)) == 1
     finally:
@@ -0,0 +1,85 @@
+import pytest
+
+from core.events import schema, validate_base_event
+
+
+def _base_event(**overrides):
+    event = {
+        "session_id": "sess-1",
+        "block_idx": 0,
+        "trial_idx": 1,
+        "actor": "player",
+        "player1_id": "p1",
+        "action": "bet",
+        "t_ui_mono_ns": 1234567890,
+    }
+    event.update(overrides)
+    return event
+
+
+def test_validate_base_event_accepts_required_and_optional_fields():
+    event = _base_event(t_device_ns=None, mapping_confidence=1, t_utc_iso="2024-01-01T00:00:00Z")
+
+    validated = validate_base_event(event)
+
+    assert validated == event
+    assert isinstance(validated["mapping_confidence"], float)
+    assert validated is not event
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"session_id": ""}, "Field 'session_id' cannot be empty"),
+        ({"block_idx": True}, "Field 'block_idx' must be an int"),
+        ({"actor": 5}, "Field 'actor' must be of type (<class 'str'>,), got int"),
+        ({"action": "raise"}, "Unsupported action: raise"),
+        ({"t_device_ns": 1.0}, "Field 't_device_ns' must be an int or None"),
+        ({"mapping_confidence": float("nan")}, "must be a finite float or None"),
+        ({"t_utc_iso": ""}, "Field 't_utc_iso' cannot be empty when provided"),
+        ({"t_utc_iso": "2024-01-01"}, "Field 't_utc_iso' must be between 19 and 32 characters"),
+        (
+            {"t_utc_iso": "2024-01-01T00:00:00\uff3a"},
+            "Field 't_utc_iso' must be between 19 and 32 characters",
+        ),
+        ({"extra": 1}, "Unexpected fields: ['extra']"),
+    ],
+)
+def test_validate_base_event_rejects_invalid_fields(overrides, message):
+    with pytest.raises(ValueError) as excinfo:
+        validate_base_event(_base_event(**overrides))
+
+    assert message in str(excinfo.value)
+
+
+def test_validate_base_event_reports_first_missing_field():
+    event = _base_event()
+    del event["trial_idx"]
+    del event["t_ui_mono_ns"]
+
+    with pytest.raises(ValueError, match="Missing required field: trial_idx"):
+        validate_base_event(event)
+
+
+def test_compiled_validator_is_cached_per_schema():
+    compile_validator = schema._compile_validator
+    actions = frozenset(schema.ALLOWED_ACTIONS)
+
+    again = compile_validator(schema._REQUIRED_FIELD_SPECS, schema._OPTIONAL_FIELD_SPECS, actions)
+    required_only = compile_validator(schema._REQUIRED_FIELD_SPECS, (), actions)
+
+    assert again is validate_base_event
+    assert required_only is not validate_base_event
+    with pytest.raises(ValueError, match="Unexpected fields"):
+        required_only(_base_event(t_device_ns=1))
+
+
+def test_validated_events_are_marked_prevalidated(monkeypatch):
+    validated = validate_base_event(_base_event())
+
+    assert type(validated) is schema.ValidatedBaseEvent
+    assert schema.is_prevalidated(validated)
+    assert not schema.is_prevalidated(_base_event())
+
+    monkeypatch.setattr(schema, "EVENT_REVALIDATE", True)
+    assert not schema.is_prevalidated(validated)
@@ -0,0 +1,36 @@
+import json
+import math
+from types import MappingProxyType
+
+import pytest
+
+from core import json_io
+
+
+def test_loads_accepts_nan_literals():
+    assert math.isnan(json_io.loads(b'{"x": NaN}')["x"])
+
+
+def test_loads_reports_stdlib_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_io.loads(b"{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_stdlib_layout(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_io, "_orjson", None)
+    elif json_io._orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"b": "ä", "a": [1, 2]}
+
+    assert json_io.dumps(data) == '{"b":"ä","a":[1,2]}'.encode("utf-8")
+    assert json_io.dumps(data, indent=True, sort_keys=True) == json.dumps(
+        data, ensure_ascii=False, indent=2, sort_keys=True
+    ).encode("utf-8")
+
+
+def test_is_mapping():
+    assert json_io.is_mapping({})
+    assert json_io.is_mapping(MappingProxyType({}))
+    assert not json_io.is_mapping([])
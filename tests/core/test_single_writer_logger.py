@@ -1,8 +1,12 @@
 import json
 import logging
+import os
 import time
 from pathlib import Path
 
+import pytest
+
+import core.single_writer_logger as single_writer_logger
 from core.single_writer_logger import SingleWriterLogger
 
 
@@ -33,3 +37,41 @@ def test_single_writer_logger_handles_high_throughput(tmp_path, caplog):
     assert len(stored) == 50_000
     assert stored[0] == {"index": 0, "value": "payload-0"}
     assert stored[-1] == {"index": 49_999, "value": "payload-49999"}
+
+
+def test_single_writer_logger_csv_uses_first_event_columns(tmp_path):
+    target = tmp_path / "events.csv"
+
+    with SingleWriterLogger(target) as logger:
+        logger.log_event({"a": 1, "b": None, "c": "x,y"})
+        logger.log_event({"b": 2, "extra": 3})
+
+    assert target.read_text(encoding="utf-8").splitlines() == ["a,b,c", '1,,"x,y"', ",2,"]
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev not available")
+def test_single_writer_logger_jsonl_retries_partial_writes(tmp_path, monkeypatch):
+    real_writev = os.writev
+
+    def short_writev(fd, buffers):
+        # Write at most five bytes per call to exercise the partial-write loop.
+        return real_writev(fd, [bytes(buffers[0])[:5]])
+
+    monkeypatch.setattr(single_writer_logger.os, "writev", short_writev)
+    target = tmp_path / "events.jsonl"
+
+    with SingleWriterLogger(target) as logger:
+        for i in range(3):
+            logger.log_event({"index": i})
+
+    assert _load_jsonl(target) == [{"index": 0}, {"index": 1}, {"index": 2}]
+
+
+def test_single_writer_logger_jsonl_buffered_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(single_writer_logger, "_HAS_WRITEV", False)
+    target = tmp_path / "events.jsonl"
+
+    with SingleWriterLogger(target) as logger:
+        logger.log_event({"index": 0})
+
+    assert _load_jsonl(target) == [{"index": 0}]
@@ -10,12 +10,20 @@ from tabletop.logging.policy import (
     is_critical_event,
     should_batch_action,
 )
+from tabletop.logging import policy
+from tabletop.utils.runtime import reload_runtime_flags
+
+
+def _reload_flags(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Swap in a fresh cache so teardown restores the untouched module-level one.
+    monkeypatch.setattr(policy, "_low_latency_cache", [-1, False])
 
 
 @pytest.fixture()
 def clear_policy_env(monkeypatch: pytest.MonkeyPatch) -> None:
     for env in ("LOW_LATENCY_DISABLED", "LOW_LATENCY_OFF"):
         monkeypatch.delenv(env, raising=False)
+    _reload_flags(monkeypatch)
 
 
 def test_is_critical_event_flags_expected_actions(clear_policy_env: None) -> None:
@@ -44,6 +52,17 @@ def test_low_latency_env_override_disables_critical(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setenv("LOW_LATENCY_DISABLED", "1")
+    _reload_flags(monkeypatch)
     assert not is_critical_event("bet")
     assert event_priority_for_action("bet") == "normal"
     assert should_batch_action("bet")
+
+
+def test_low_latency_flag_cached_until_reload(
+    monkeypatch: pytest.MonkeyPatch, clear_policy_env: None
+) -> None:
+    assert is_critical_event("bet")
+    monkeypatch.setenv("LOW_LATENCY_DISABLED", "1")
+    assert is_critical_event("bet")
+    reload_runtime_flags()
+    assert not is_critical_event("bet")
@@ -1,6 +1,10 @@
 import csv
+import sqlite3
+import threading
+import time
 from pathlib import Path
 
+from core.events import error_logger
 from tabletop.logging.ui_events import UIEventLocalLogger, UIEventSender
 
 
@@ -30,16 +34,83 @@ def test_sequence_number_persisted_in_csv(tmp_path: Path) -> None:
     assert csv_path.exists()
 
     with csv_path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        rows = list(reader)
+        reader = csv.reader(handle)
+        column = next(reader).index("sequence_no")
+        sequence_numbers = [row[column] for row in reader]
+
+    assert sequence_numbers == ["1", "2", "3"]
+
+
+def test_sqlite_rows_flushed_in_batches(tmp_path: Path) -> None:
+    log_dir = tmp_path / "logs"
+    local_logger = UIEventLocalLogger(log_dir, "session-db")
+    sender = UIEventSender(local_logger=local_logger)
+    db_path = log_dir / "ui_events_session-db.sqlite3"
+
+    def _count() -> int:
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM ui_events").fetchone()[0]
+
+    def _wait_for(expected: int) -> None:
+        deadline = time.monotonic() + 2.0
+        while _count() < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count() == expected
+
+    try:
+        for idx in range(3):
+            sender.send_event(_base_event(idx))
+        _wait_for(3)
+
+        # The idle flusher is woken again by the next pending row.
+        for idx in range(3, 5):
+            sender.send_event(_base_event(idx))
+        _wait_for(5)
+
+        for idx in range(5, 40):
+            sender.send_event(_base_event(idx))
+    finally:
+        sender.close()
+
+    with sqlite3.connect(db_path) as conn:
+        trials = [row[0] for row in conn.execute("SELECT trial_idx FROM ui_events")]
+    assert trials == list(range(40))
+
+
+def test_cloud_events_forwarded_in_order_off_thread(tmp_path: Path) -> None:
+    class _RecordingClient:
+        def __init__(self) -> None:
+            self.calls: list[tuple[int, str, str]] = []
+            self.closed = False
+
+        def send_event(self, payload, priority="normal") -> None:
+            self.calls.append((payload["trial_idx"], priority, threading.current_thread().name))
+
+        def close(self) -> None:
+            self.closed = True
+
+    client = _RecordingClient()
+    sender = UIEventSender(cloud_client=client)  # type: ignore[arg-type]
+    try:
+        for idx in range(5):
+            sender.send_event(_base_event(idx), priority="high" if idx % 2 else "normal")
+    finally:
+        sender.close()
 
-    assert [row.get("sequence_no") for row in rows] == ["1", "2", "3"]
+    assert [call[:2] for call in client.calls] == [
+        (0, "normal"),
+        (1, "high"),
+        (2, "normal"),
+        (3, "high"),
+        (4, "normal"),
+    ]
+    assert all(call[2] != threading.current_thread().name for call in client.calls)
+    assert client.closed
 
 
-def test_invalid_action_logged(tmp_path: Path) -> None:
-    error_log = Path("logs/event_errors.csv")
-    if error_log.exists():
-        error_log.unlink()
+def test_invalid_action_logged(tmp_path: Path, monkeypatch) -> None:
+    error_log = tmp_path / "event_errors.csv"
+    monkeypatch.setattr(error_logger, "_ERROR_LOG_PATH", error_log)
 
     sender = UIEventSender()
     try:
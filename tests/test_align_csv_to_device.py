@@ -0,0 +1,206 @@
+import csv
+import json
+import sys
+
+import pytest
+
+import align_csv_to_device as align
+import core.offset_sync as offset_sync
+
+
+@pytest.fixture(params=["arrow", "pandas", "rows"])
+def backend(request, monkeypatch):
+    if request.param == "arrow":
+        if align._pacsv is None or align._np is None:
+            pytest.skip("pyarrow/numpy not installed")
+    elif request.param == "pandas":
+        if align._pd is None or align._np is None:
+            pytest.skip("pandas/numpy not installed")
+        monkeypatch.setattr(align, "_pacsv", None)
+    else:
+        monkeypatch.setattr(align, "_pacsv", None)
+        monkeypatch.setattr(align, "_pd", None)
+    return request.param
+
+
+@pytest.fixture()
+def offsets(monkeypatch):
+    monkeypatch.setattr(offset_sync, "_offsets", {"vp1": 100, "vp2": -50})
+
+
+def _write_inputs(tmp_path, rows):
+    csv_path = tmp_path / "events.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.DictWriter(fp, fieldnames=["t_host_ns", "event", "payload"])
+        writer.writeheader()
+        writer.writerows(rows)
+    state_path = tmp_path / "runtime_state.json"
+    state_path.write_text(
+        json.dumps(
+            {
+                "vp1": {"recording_id": "rec-1"},
+                "devices": [{"device": "VP2", "recording_id": "rec-2"}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return csv_path, state_path
+
+
+def _run(monkeypatch, csv_path, state_path, output_path, *extra_args):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "align_csv_to_device.py",
+            "--csv",
+            str(csv_path),
+            "--runtime-state",
+            str(state_path),
+            "--output",
+            str(output_path),
+            *extra_args,
+        ],
+    )
+    align.main()
+    with output_path.open("r", encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp if line.strip()]
+
+
+def test_main_aligns_rows(tmp_path, monkeypatch, offsets, backend):
+    csv_path, state_path = _write_inputs(
+        tmp_path,
+        [
+            {"t_host_ns": "1000", "event": "start", "payload": '{"round": 1}'},
+            {"t_host_ns": "1500", "event": "note", "payload": "plain text"},
+            {"t_host_ns": "2000", "event": "", "payload": ""},
+        ],
+    )
+
+    records = _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
+
+    assert records == [
+        {
+            "event": "start",
+            "t_host_ns": 1000,
+            "vp1": {"t_world_ns": 900, "rec_id": "rec-1"},
+            "vp2": {"t_world_ns": 1050, "rec_id": "rec-2"},
+            "payload": {"round": 1},
+        },
+        {
+            "event": "note",
+            "t_host_ns": 1500,
+            "vp1": {"t_world_ns": 1400, "rec_id": "rec-1"},
+            "vp2": {"t_world_ns": 1550, "rec_id": "rec-2"},
+            "payload": "plain text",
+        },
+        {
+            "event": "",
+            "t_host_ns": 2000,
+            "vp1": {"t_world_ns": 1900, "rec_id": "rec-1"},
+            "vp2": {"t_world_ns": 2050, "rec_id": "rec-2"},
+        },
+    ]
+
+
+def test_main_rejects_time_regression(tmp_path, monkeypatch, offsets, backend):
+    csv_path, state_path = _write_inputs(
+        tmp_path,
+        [
+            {"t_host_ns": "2000", "event": "a", "payload": ""},
+            {"t_host_ns": "1000", "event": "b", "payload": ""},
+        ],
+    )
+
+    with pytest.raises(ValueError, match="Zeitordnung verletzt für vp1: 900 < 1900"):
+        _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
+
+
+def test_main_parallel_workers_match_sequential(tmp_path, monkeypatch, offsets):
+    rows = [
+        {"t_host_ns": str(1000 + idx * 10), "event": f"e{idx}", "payload": str(idx)}
+        for idx in range(50)
+    ]
+    csv_path, state_path = _write_inputs(tmp_path, rows)
+
+    sequential = _run(monkeypatch, csv_path, state_path, tmp_path / "seq.jsonl")
+    parallel = _run(
+        monkeypatch, csv_path, state_path, tmp_path / "par.jsonl", "--workers", "4"
+    )
+
+    assert parallel == sequential
+    assert not list(tmp_path.glob("par.jsonl.part-*"))
+
+
+def test_main_parallel_detects_regression_across_chunks(tmp_path, monkeypatch, offsets):
+    rows = [{"t_host_ns": str(5000 - idx), "event": "", "payload": ""} for idx in range(40)]
+    csv_path, state_path = _write_inputs(tmp_path, rows)
+
+    with pytest.raises(ValueError, match="Zeitordnung verletzt für vp1"):
+        _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl", "--workers", "3")
+
+
+def test_main_parallel_reports_row_of_whole_file(tmp_path, monkeypatch, offsets):
+    rows = [
+        {"t_host_ns": str(1000 + idx * 10), "event": "", "payload": ""} for idx in range(40)
+    ]
+    rows[35]["t_host_ns"] = "bad"
+    csv_path, state_path = _write_inputs(tmp_path, rows)
+
+    with pytest.raises(ValueError, match="in Zeile 36: bad"):
+        _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl", "--workers", "4")
+
+
+def test_main_ignores_late_type_change_in_extra_column(tmp_path, monkeypatch, offsets, backend):
+    monkeypatch.setattr(align, "_ARROW_BLOCK_SIZE", 1 << 10)
+    monkeypatch.setattr(align, "_CHUNK_ROWS", 16)
+    csv_path, state_path = _write_inputs(tmp_path, [])
+    with csv_path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(["t_host_ns", "event", "payload", "round"])
+        for idx in range(200):
+            writer.writerow([1000 + idx, "e", "", idx if idx < 150 else "abc"])
+
+    records = _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
+
+    assert len(records) == 200
+    assert records[-1]["t_host_ns"] == 1199
+
+
+def test_main_missing_host_without_timestamp_column(tmp_path, monkeypatch, offsets, backend):
+    csv_path, state_path = _write_inputs(
+        tmp_path, [{"t_host_ns": "", "event": "a", "payload": ""}]
+    )
+
+    with pytest.raises(KeyError, match="Spalte 't_host_ns' fehlt"):
+        _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
+
+
+def test_main_accepts_newlines_in_quoted_payload(tmp_path, monkeypatch, offsets, backend):
+    monkeypatch.setattr(align, "_ARROW_BLOCK_SIZE", 1 << 10)
+    monkeypatch.setattr(align, "_CHUNK_ROWS", 16)
+    csv_path, state_path = _write_inputs(
+        tmp_path,
+        [
+            {"t_host_ns": str(1000 + idx), "event": "note", "payload": f"line {idx}\nmore"}
+            for idx in range(200)
+        ],
+    )
+
+    records = _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
+
+    assert len(records) == 200
+    assert records[-1]["payload"] == "line 199\nmore"
+
+
+def test_main_rejects_fractional_host_timestamp(tmp_path, monkeypatch, offsets, backend):
+    csv_path, state_path = _write_inputs(
+        tmp_path,
+        [
+            {"t_host_ns": "1000", "event": "a", "payload": ""},
+            {"t_host_ns": "1.5", "event": "b", "payload": ""},
+        ],
+    )
+
+    with pytest.raises(ValueError, match="Ungültiger t_host_ns"):
+        _run(monkeypatch, csv_path, state_path, tmp_path / "out.jsonl")
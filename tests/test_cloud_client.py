@@ -1,4 +1,9 @@
+import ast
+import functools
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from types import SimpleNamespace
 from unittest import mock
 
@@ -8,6 +13,11 @@ from cloud import client as cloud_client
 from cloud.payload import build_cloud_payload
 
 
+@functools.lru_cache(maxsize=4)
+def _parsed_source(path: str) -> ast.Module:
+    return ast.parse(Path(path).read_text(encoding="utf-8"))
+
+
 @pytest.fixture(autouse=True)
 def reset_append_only_mode():
     original = cloud_client.append_only_mode
@@ -18,6 +28,13 @@ def reset_append_only_mode():
         cloud_client.append_only_mode = original
 
 
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    cloud_client.reset_config_cache()
+    yield
+    cloud_client.reset_config_cache()
+
+
 def test_minimal_payload_keys():
     payload = build_cloud_payload(
         action="card_flip", actor="VP1", player1_id="VP1", session_id=None
@@ -29,6 +46,7 @@ def test_payload_with_extra_key_logs_and_raises(monkeypatch, tmp_path):
     log_path = tmp_path / "violation.log"
     monkeypatch.setattr(cloud_client, "_PAYLOAD_VIOLATION_LOG", log_path)
     monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    cloud_client.reset_config_cache()
 
     called = False
 
@@ -54,6 +72,7 @@ def test_payload_with_extra_key_logs_and_raises(monkeypatch, tmp_path):
 
 def test_append_only_idempotency(monkeypatch):
     monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    cloud_client.reset_config_cache()
 
     events = []
     seen_keys: dict[str, int] = {}
@@ -87,6 +106,218 @@ def test_append_only_idempotency(monkeypatch):
     assert seen_keys["k2"] == 1
 
 
+def test_server_error_raises_after_session_retries(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    cloud_client.reset_config_cache()
+
+    calls = []
+
+    def _fake_send(_url, payload, _headers):
+        calls.append(payload)
+        return SimpleNamespace(status_code=503, text="unavailable")
+
+    monkeypatch.setattr(cloud_client, "_send_request", _fake_send)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+
+    with pytest.raises(cloud_client.AppendEventError):
+        cloud_client.append_event(payload, idempotency_key="k-503")
+
+    assert len(calls) == 1
+
+
+def test_session_mounts_pooled_retrying_adapter(monkeypatch):
+    pytest.importorskip("requests")
+    monkeypatch.setattr(cloud_client, "_session", None)
+
+    session = cloud_client._get_session()
+    adapter = session.get_adapter("https://example.invalid")
+
+    assert adapter.max_retries.total == cloud_client._MAX_ATTEMPTS - 1
+    assert 503 in adapter.max_retries.status_forcelist
+    assert 501 in adapter.max_retries.status_forcelist
+    assert "POST" in adapter.max_retries.allowed_methods
+
+
+def test_retry_backs_off_before_first_retry():
+    pytest.importorskip("requests")
+    from urllib3.util.retry import RequestHistory
+
+    retry = cloud_client._Retry(total=4, backoff_factor=0.5)
+    failure = RequestHistory("POST", "/events", None, 503, None)
+
+    assert retry.new(history=(failure,)).get_backoff_time() == 0.5
+    assert retry.new(history=(failure,) * 2).get_backoff_time() == 1.0
+    assert retry.new(history=(failure,) * 4).get_backoff_time() == 4.0
+
+
+@pytest.fixture
+def flaky_endpoint(monkeypatch):
+    """Serve append requests locally, answering with queued status codes."""
+
+    pytest.importorskip("requests")
+    statuses: list = []
+    keys: list = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            keys.append(self.headers.get("Idempotency-Key"))
+            self.send_response(statuses.pop(0) if statuses else 503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("SENDE_EVENTS_URL", f"http://127.0.0.1:{server.server_port}/events")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    cloud_client.reset_config_cache()
+    monkeypatch.setattr(cloud_client, "_INITIAL_BACKOFF", 0.0)
+    monkeypatch.setattr(cloud_client, "_session", None)
+    try:
+        yield statuses, keys
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_append_event_retries_server_errors(flaky_endpoint):
+    statuses, keys = flaky_endpoint
+    statuses.extend([503, 502, 201])
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+
+    cloud_client.append_event(payload, idempotency_key="retry-key")
+
+    assert keys == ["retry-key"] * 3
+
+
+def test_append_event_fails_after_last_retry(flaky_endpoint):
+    _statuses, keys = flaky_endpoint
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+
+    with pytest.raises(cloud_client.AppendEventError):
+        cloud_client.append_event(payload, idempotency_key="fail-key")
+
+    assert keys == ["fail-key"] * cloud_client._MAX_ATTEMPTS
+
+
+def test_append_events_sends_single_ndjson_request(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    cloud_client.reset_config_cache()
+
+    requests_sent = []
+
+    def _fake_bulk(_url, body, headers):
+        requests_sent.append((body, dict(headers)))
+        return SimpleNamespace(status_code=201, text="created")
+
+    monkeypatch.setattr(cloud_client, "_send_bulk_request", _fake_bulk)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    cloud_client.append_events([dict(payload), dict(payload)], ["k1", "k2"])
+
+    assert len(requests_sent) == 1
+    body, headers = requests_sent[0]
+    assert headers["Content-Type"] == "application/x-ndjson"
+    assert headers["Idempotency-Key"].startswith("batch-")
+    lines = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+    assert [line["client_idempotency_key"] for line in lines] == ["k1", "k2"]
+
+
+def test_append_events_many_multiplexes_on_one_client(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid/events")
+    cloud_client.reset_config_cache()
+
+    seen: list[tuple[str, dict]] = []
+
+    def _handler(request):
+        seen.append((request.headers["Idempotency-Key"], json.loads(request.content)))
+        status = 409 if request.headers["Idempotency-Key"] == "dup" else 201
+        return httpx.Response(status, text="ok")
+
+    clients = []
+
+    def _client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(cloud_client, "_get_async_client", _client)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    cloud_client.append_events_many(
+        [(dict(payload), "k1"), (dict(payload), "k2"), (dict(payload), "dup")]
+    )
+
+    assert len(clients) == 1
+    assert sorted(key for key, _ in seen) == ["dup", "k1", "k2"]
+    assert all(body["client_idempotency_key"] == key for key, body in seen)
+
+
+def test_config_cached_until_reset(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://first.invalid")
+    monkeypatch.setenv("SENDE_API_KEY", "key-1")
+    cloud_client.reset_config_cache()
+
+    assert cloud_client._get_append_url() == "https://first.invalid"
+    assert cloud_client._build_headers("a")["apikey"] == "key-1"
+
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://second.invalid")
+    monkeypatch.setenv("SENDE_API_KEY", "key-2")
+    assert cloud_client._get_append_url() == "https://first.invalid"
+
+    cloud_client.reset_config_cache()
+    assert cloud_client._get_append_url() == "https://second.invalid"
+    headers = cloud_client._build_headers("b")
+    assert headers["Authorization"] == "Bearer key-2"
+    assert headers["Idempotency-Key"] == "b"
+
+
+def test_append_event_async_retries_server_errors(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    import asyncio
+
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid/events")
+    cloud_client.reset_config_cache()
+    monkeypatch.setattr(cloud_client, "_retry_delay", lambda _attempt: 0.0)
+
+    statuses = iter([503, 502, 201])
+    attempts = []
+
+    def _handler(request):
+        attempts.append(request.headers["Idempotency-Key"])
+        return httpx.Response(next(statuses), text="")
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await cloud_client.append_event_async(
+                payload, idempotency_key="k-async", client=client
+            )
+
+    asyncio.run(_run())
+
+    assert attempts == ["k-async"] * 3
+
+
 def test_update_event_noop_in_append_only_mode(caplog):
     caplog.set_level("WARNING")
     cloud_client.update_event({"action": "card_flip"})
@@ -94,11 +325,7 @@ def test_update_event_noop_in_append_only_mode(caplog):
 
 
 def test_ui_order_send_before_mutation():
-    import ast
-    from pathlib import Path
-
-    source = Path("tabletop/tabletop_view.py").read_text(encoding="utf-8")
-    tree = ast.parse(source)
+    tree = _parsed_source("tabletop/tabletop_view.py")
 
     def _find_start_pressed() -> ast.FunctionDef:
         for node in tree.body:
@@ -110,20 +337,134 @@ def test_ui_order_send_before_mutation():
 
     func = _find_start_pressed()
 
-    class _Collector(ast.NodeVisitor):
-        def __init__(self) -> None:
-            self.calls: list[str] = []
+    targets = {"_append_minimal_cloud_event", "record_action"}
+    # ``ast.walk`` is breadth-first, so matches are put back into source order.
+    matches = sorted(
+        (node.lineno, node.col_offset, node.func.attr)
+        for node in ast.walk(func)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in targets
+    )
+    calls = [attr for _, _, attr in matches]
+
+    assert "_append_minimal_cloud_event" in calls
+    assert "record_action" in calls
+    assert calls.index("_append_minimal_cloud_event") < calls.index("record_action")
+
+
+def test_append_event_buffers_within_batch_window(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    monkeypatch.setenv("SENDE_BATCH_WINDOW_MS", "60000")
+    cloud_client.reset_config_cache()
+
+    bodies = []
+
+    def _fake_bulk(_url, body, _headers):
+        bodies.append(body)
+        return SimpleNamespace(status_code=201, text="created")
+
+    monkeypatch.setattr(cloud_client, "_send_bulk_request", _fake_bulk)
+    monkeypatch.setattr(cloud_client, "_send_request", pytest.fail)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    for key in ("k1", "k2", "k3"):
+        cloud_client.append_event(dict(payload), idempotency_key=key)
+    assert bodies == []
+
+    cloud_client.flush_buffered_events()
+
+    assert len(bodies) == 1
+    lines = [json.loads(line) for line in bodies[0].decode("utf-8").splitlines()]
+    assert [line["client_idempotency_key"] for line in lines] == ["k1", "k2", "k3"]
+
+
+def test_buffered_batch_is_requeued_after_failure(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    monkeypatch.setenv("SENDE_BATCH_WINDOW_MS", "60000")
+    cloud_client.reset_config_cache()
+
+    statuses = [503, 201]
+    bodies = []
+
+    def _fake_bulk(_url, body, _headers):
+        bodies.append(body)
+        return SimpleNamespace(status_code=statuses.pop(0), text="")
+
+    monkeypatch.setattr(cloud_client, "_send_bulk_request", _fake_bulk)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    for key in ("k1", "k2"):
+        cloud_client.append_event(dict(payload), idempotency_key=key)
+
+    cloud_client.flush_buffered_events()
+    cloud_client.flush_buffered_events()
 
-        def visit_Call(self, node: ast.Call) -> None:  # noqa: N802 - ast API
-            func = node.func
-            if isinstance(func, ast.Attribute):
-                if func.attr in {"_append_minimal_cloud_event", "record_action"}:
-                    self.calls.append(func.attr)
-            self.generic_visit(node)
+    assert len(bodies) == 2
+    assert bodies[0] == bodies[1]
+    assert cloud_client._buffer.dropped == 0
 
-    collector = _Collector()
-    collector.visit(func)
 
-    assert "_append_minimal_cloud_event" in collector.calls
-    assert "record_action" in collector.calls
-    assert collector.calls.index("_append_minimal_cloud_event") < collector.calls.index("record_action")
+def test_buffered_events_are_sent_when_window_expires(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    monkeypatch.setenv("SENDE_BATCH_WINDOW_MS", "10")
+    cloud_client.reset_config_cache()
+
+    sent = threading.Event()
+
+    def _fake_bulk(_url, body, _headers):
+        sent.set()
+        return SimpleNamespace(status_code=201, text="created")
+
+    monkeypatch.setattr(cloud_client, "_send_bulk_request", _fake_bulk)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    cloud_client.append_event(dict(payload), idempotency_key="k1")
+
+    assert sent.wait(5.0)
+
+
+def test_rejected_buffered_batch_is_dropped(monkeypatch):
+    monkeypatch.setenv("SENDE_EVENTS_URL", "https://example.invalid")
+    monkeypatch.setenv("SENDE_BATCH_WINDOW_MS", "60000")
+    cloud_client.reset_config_cache()
+
+    statuses = [400, 201]
+    bodies = []
+
+    def _fake_bulk(_url, body, _headers):
+        bodies.append(body)
+        return SimpleNamespace(status_code=statuses.pop(0), text="")
+
+    monkeypatch.setattr(cloud_client, "_send_bulk_request", _fake_bulk)
+    monkeypatch.setattr(cloud_client._buffer, "dropped", 0)
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    cloud_client.append_event(dict(payload), idempotency_key="bad")
+    cloud_client.flush_buffered_events()
+    cloud_client.append_event(dict(payload), idempotency_key="good")
+    cloud_client.flush_buffered_events()
+
+    assert len(bodies) == 2
+    assert json.loads(bodies[1])["client_idempotency_key"] == "good"
+    assert cloud_client._buffer.dropped == 1
+
+
+def test_buffered_append_requires_url(monkeypatch):
+    monkeypatch.delenv("SENDE_EVENTS_URL", raising=False)
+    monkeypatch.setenv("SENDE_BATCH_WINDOW_MS", "60000")
+    cloud_client.reset_config_cache()
+
+    payload = build_cloud_payload(
+        action="card_flip", actor="VP1", player1_id="VP1", session_id=None
+    )
+    with pytest.raises(RuntimeError, match="SENDE_EVENTS_URL"):
+        cloud_client.append_event(dict(payload), idempotency_key="k1")
@@ -117,3 +117,78 @@ def test_capture_sync_point_appends_entries(isolated_offsets):
         lines = [line for line in f if line.strip()]
 
     assert len(lines) == 2
+
+
+def test_get_offset_ns_matches_host_to_dev(isolated_offsets):
+    offset_sync.estimate_offset({"t_host_ns": 5_000, "t_dev_ns": 1_000, "device": "vp2"})
+
+    offset = offset_sync.get_offset_ns("vp2")
+
+    assert offset == 4_000
+    assert offset_sync.host_to_dev(9_000, "vp2") == 9_000 - offset
+
+    with pytest.raises(KeyError):
+        offset_sync.get_offset_ns("vp1")
+
+
+def test_array_conversions_match_scalar(isolated_offsets):
+    np = pytest.importorskip("numpy")
+    offset_sync.estimate_offset({"t_host_ns": 7_000, "t_dev_ns": 2_000, "device": "vp1"})
+
+    host = np.array([0, 5_000, 1_000_000_000_000], dtype=np.int64)
+    dev = offset_sync.host_to_dev_array(host, "vp1")
+
+    assert dev.tolist() == [offset_sync.host_to_dev(int(t), "vp1") for t in host]
+    assert offset_sync.dev_to_host_array(dev, "vp1").tolist() == host.tolist()
+
+
+def test_array_roundtrip_bulk(isolated_offsets):
+    np = pytest.importorskip("numpy")
+    offset_sync.estimate_offset({"t_host_ns": 1_000, "t_dev_ns": 9_000, "device": "vp1"})
+
+    host = np.arange(10_000, dtype=np.int64) * 1_000_003
+
+    roundtrip = offset_sync.dev_to_host_array(offset_sync.host_to_dev_array(host, "vp1"), "vp1")
+
+    assert roundtrip.dtype == np.int64
+    assert np.array_equal(roundtrip, host)
+
+
+def test_load_offsets_warns_about_unknown_devices(isolated_offsets, caplog):
+    isolated_offsets.parent.mkdir(parents=True, exist_ok=True)
+    isolated_offsets.write_text(json.dumps({"vp1": 5, "vp3": 7}), encoding="utf-8")
+
+    with caplog.at_level("WARNING", logger=offset_sync.__name__):
+        offsets = offset_sync._load_offsets()
+
+    assert offsets == {"vp1": 5}
+    assert "vp3" in caplog.text
+
+
+def test_failing_listener_does_not_mask_capture_error(isolated_offsets, caplog):
+    calls = []
+
+    def _broken_listener():
+        raise RuntimeError("listener broke")
+
+    def _listener():
+        calls.append("notified")
+
+    offset_sync.add_offset_listener(_broken_listener)
+    offset_sync.add_offset_listener(_listener)
+    try:
+        neon_event = {
+            "devices": {
+                "vp1": {"t_dev_ns": 100},
+                "vp2": {"recording_id": "rec"},
+            }
+        }
+        with pytest.raises(KeyError, match="t_dev_ns"):
+            offset_sync.capture_sync_point({"t_host_ns": 1_000}, neon_event)
+    finally:
+        offset_sync.remove_offset_listener(_broken_listener)
+        offset_sync.remove_offset_listener(_listener)
+
+    assert calls == ["notified"]
+    assert offset_sync.get_offset_ns("vp1") == 900
+    assert "listener broke" in caplog.text
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 
+from qc import report
 from qc.report import emit_latency_summary, emit_mapping_summary
 
 
@@ -103,3 +104,17 @@ def test_emit_latency_summary_filters_and_computes_percentiles(
     assert row["latency_samples"] == "4"
     assert row["median_latency_ns"] == "90"
     assert row["p95_latency_ns"] == "114"
+
+
+def test_append_rows_writes_header_once(tmp_path: Path) -> None:
+    config = report._SummaryConfig(
+        output_dir=tmp_path / "qc", filename="batch.csv", fieldnames=("a", "b")
+    )
+
+    report._append_rows(config, [{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+    report._append_row(config, {"a": 5, "b": 6})
+
+    with config.path.open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))
+
+    assert rows == [["a", "b"], ["1", "2"], ["3", "4"], ["5", "6"]]
@@ -1,7 +1,7 @@
 import logging
 import threading
-import time
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 import pytest
 
@@ -9,91 +9,141 @@ import core.offset_sync as offset_sync
 from tabletop.start_gate import StartGate
 
 
+_NO_SENSORS: Mapping[str, bool] = MappingProxyType({})
+
+
 class _DummyBridge:
     def __init__(self) -> None:
         self.connected: Dict[str, bool] = {"VP1": True, "VP2": True}
-        self.sensors: Dict[str, Dict[str, bool]] = {
-            "VP1": {},
-            "VP2": {},
+        # Read-only views of the snapshots are handed out without copying;
+        # updates through set_sensors show up in them immediately.
+        self._snapshots: Dict[str, Dict[str, bool]] = {"VP1": {}, "VP2": {}}
+        self._proxies = {
+            player: MappingProxyType(snapshot) for player, snapshot in self._snapshots.items()
         }
         self.recording_ids: Dict[str, str] = {}
 
+    def set_sensors(self, player: str, sensors: Dict[str, bool]) -> None:
+        self._snapshots[player].update(sensors)
+
+    def make_all_ready(self, gate: StartGate) -> None:
+        """Satisfy every start condition, then wake *gate* for a single re-check."""
+
+        for player in self._snapshots:
+            self.set_sensors(player, {sensor: True for sensor in gate.required_sensors})
+        self.recording_ids = {"VP1": "r1", "VP2": "r2"}
+        offset_sync._offsets.update({"vp1": 0, "vp2": 0})
+        gate.notify()
+
     def is_connected(self, player: str) -> bool:
         return self.connected.get(player, False)
 
-    def get_sensor_snapshot(self, player: str) -> Dict[str, bool]:
-        return dict(self.sensors.get(player, {}))
+    def get_sensor_snapshot(self, player: str) -> Mapping[str, bool]:
+        return self._proxies.get(player, _NO_SENSORS)
 
     def get_recording_id(self, player: str):
         return self.recording_ids.get(player)
 
 
+class _LogEvent(logging.Handler):
+    """Record messages containing *needle* and set :attr:`event` for each."""
+
+    def __init__(self, needle: str) -> None:
+        super().__init__()
+        self.needle = needle
+        self.messages: list[str] = []
+        self.event = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if self.needle in message:
+            self.messages.append(message)
+            self.event.set()
+
+
 @pytest.fixture
 def isolated_offsets(tmp_path, monkeypatch):
     offsets_path = tmp_path / "sync" / "offsets.json"
     sync_points_path = tmp_path / "sync" / "sync_points.jsonl"
     monkeypatch.setattr(offset_sync, "_OFFSETS_PATH", offsets_path)
     monkeypatch.setattr(offset_sync, "_SYNC_POINTS_PATH", sync_points_path)
-    offset_sync._offsets = {}
+    # Mutated in place so references held elsewhere stay valid.
+    saved = dict(offset_sync._offsets)
+    offset_sync._offsets.clear()
     yield
-    offset_sync._offsets = {}
+    offset_sync._offsets.clear()
+    offset_sync._offsets.update(saved)
 
 
-def test_start_gate_waits_for_all_conditions(isolated_offsets):
+@pytest.fixture
+def gate_and_bridge(request, caplog, isolated_offsets):
     bridge = _DummyBridge()
-    logger = logging.getLogger("test.start_gate")
+    logger = logging.getLogger("tabletop.start_gate")
+    caplog.set_level(logging.INFO, logger="tabletop.start_gate")
+    # The gate logs whenever its blockers change, which marks each observed step.
+    waiting = _LogEvent("START-GATE waiting")
+    logger.addHandler(waiting)
+    request.addfinalizer(lambda: logger.removeHandler(waiting))
     gate = StartGate(
         bridge,
         players=("VP1", "VP2"),
         poll_interval=0.01,
         logger=logger,
     )
-    ready = threading.Event()
-    gate.start(ready.set)
+    request.addfinalizer(gate.stop)
+    return bridge, gate, threading.Event(), waiting
 
-    time.sleep(0.05)
-    assert not ready.is_set()
 
+def test_start_gate_waits_for_all_conditions(gate_and_bridge):
+    bridge, gate, ready, waiting = gate_and_bridge
+    gate.start(ready.set)
+    assert waiting.event.wait(1.0)
+    assert not ready.wait(0.02)
+
+    waiting.event.clear()
     for player in ("VP1", "VP2"):
-        bridge.sensors[player] = {sensor: True for sensor in gate.required_sensors}
-    time.sleep(0.05)
+        bridge.set_sensors(player, {sensor: True for sensor in gate.required_sensors})
+    assert waiting.event.wait(1.0)
     assert not ready.is_set()
 
+    waiting.event.clear()
     bridge.recording_ids = {"VP1": "r1", "VP2": "r2"}
-    time.sleep(0.05)
+    assert waiting.event.wait(1.0)
     assert not ready.is_set()
 
-    offset_sync._offsets = {"vp1": 0, "vp2": 0}
-    assert ready.wait(0.2)
-    gate.stop()
+    offset_sync._offsets.update({"vp1": 0, "vp2": 0})
+    assert ready.wait(1.0)
 
 
-def test_start_gate_logs_blockers(caplog, isolated_offsets):
-    bridge = _DummyBridge()
-    logger = logging.getLogger("tabletop.start_gate")
-    caplog.set_level(logging.INFO, logger="tabletop.start_gate")
-    gate = StartGate(
-        bridge,
-        players=("VP1", "VP2"),
-        poll_interval=0.01,
-        logger=logger,
-    )
-    ready = threading.Event()
+def test_start_gate_logs_blockers(gate_and_bridge):
+    bridge, gate, ready, waiting = gate_and_bridge
     gate.start(ready.set)
+    assert waiting.event.wait(1.0)
 
-    for _ in range(100):
-        if any("START-GATE waiting" in record.message for record in caplog.records):
-            break
-        time.sleep(0.01)
+    assert any("sensors" in message for message in waiting.messages)
 
-    assert any(
-        "START-GATE waiting" in record.message and "sensors" in record.message
-        for record in caplog.records
-    )
+    bridge.make_all_ready(gate)
+    assert ready.wait(1.0)
 
+
+def test_start_gate_wakes_on_notifications(isolated_offsets):
+    bridge = _DummyBridge()
     for player in ("VP1", "VP2"):
-        bridge.sensors[player] = {sensor: True for sensor in gate.required_sensors}
+        bridge.set_sensors(player, {sensor: True for sensor in StartGate.DEFAULT_SENSORS})
+    listeners = []
+    bridge.add_state_listener = listeners.append
+    bridge.remove_state_listener = listeners.remove
+    gate = StartGate(bridge, players=("VP1", "VP2"), poll_interval=30.0)
+    ready = threading.Event()
+    gate.start(ready.set)
+
     bridge.recording_ids = {"VP1": "r1", "VP2": "r2"}
-    offset_sync._offsets = {"vp1": 0, "vp2": 0}
-    assert ready.wait(0.2)
+    for callback in listeners:
+        callback()
+    offset_sync.estimate_offset({"device": "vp1", "t_host_ns": 10, "t_dev_ns": 5})
+    offset_sync.estimate_offset({"device": "vp2", "t_host_ns": 10, "t_dev_ns": 5})
+
+    assert ready.wait(1.0)
     gate.stop()
+    assert not listeners
+    assert gate.notify not in offset_sync._listeners